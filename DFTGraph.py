@@ -1,19 +1,32 @@
+import hashlib
+from collections import OrderedDict
+
 import pyqtgraph as pg
 import numpy as np
 from PySide6 import QtCore
 
+from Precision import Precision
+from Profiler import Profiler
+
 
 class DFTGraph():
+    # Number of recent inputs whose spectrum is kept by compute_FFT
+    MAX_CACHED_SPECTRA = 8
+
+    # Repetitions are drawn at n * sampling frequency for n in this range
+    REPETITIONS = np.arange(-2, 3)
+
+    spectrum_cache = OrderedDict()
+
     def __init__(self):
         self.DFT_plot_widget = pg.PlotWidget()
 
         # Add legend to the plot
         self.legend = pg.LegendItem(offset=(-10, 2))  # Adjust offset as needed
         self.legend.setParentItem(self.DFT_plot_widget.plotItem)  # Set the legend as a child of the plot item
-        self.legend.hide()
 
         self.DFT_plot_widget.plotItem.setTitle("DFT Magnitude Plot")
-        self.DFT_plot_widget.plotItem.setLabel(axis="left", text="|F(f)|")  # \u03C9
+        self.DFT_plot_widget.plotItem.setLabel(axis="left", text="|F(f)|")  # ω
         self.DFT_plot_widget.plotItem.setLabel(axis="bottom", text="f", units="HZ")
         self.DFT_plot_widget.plotItem.showGrid(x=True)
 
@@ -22,79 +35,110 @@ class DFTGraph():
         self.sampling_frequency_pen = pg.mkPen(color='orange', width=2)
         self.repetition_pen = pg.mkPen(color=(0, 255, 0, 128), width=1, style=QtCore.Qt.DashDotLine)
 
+        # Long-lived impulse items, each impulse being one (f, 0) -> (f, magnitude) segment
+        self.sampling_frequency_item = pg.PlotDataItem(pen=self.sampling_frequency_pen, connect='pairs')
+        self.original_item = pg.PlotDataItem(pen=self.original_pen, connect='pairs')
+        self.repetition_item = pg.PlotDataItem(pen=self.repetition_pen, connect='pairs')
+        for item in (self.sampling_frequency_item, self.original_item, self.repetition_item):
+            self.DFT_plot_widget.addItem(item)
+        self.legend.addItem(self.sampling_frequency_item, "Sampling Frequency")
+        self.legend.addItem(self.original_item, "Original Signal Components")
+        self.repetitions_in_legend = False
+
+        # Last drawn spectrum, so toggling the repetitions needs no FFT
+        self.FFT_magnitude = np.empty(0)
+        self.frequency_bins = np.empty(0)
+        self.reconstruction_sampling_frequency = 1
+
     def draw_DFT_magnitude(self, data_points, og_sampling_period, reconstruction_sampling_frequency,
                            show_repetitions=False):
         """Plots the discrete fourier transform magnitude using FFT."""
-        self.DFT_plot_widget.plotItem.clear()
-        self.legend.clear()
-
         FFT_magnitude, frequency_bins = self.compute_FFT(data_points, og_sampling_period)
+        self.draw_spectrum(FFT_magnitude, frequency_bins, reconstruction_sampling_frequency, show_repetitions)
 
-        # Draw sampling frequency impulses
-        sampling_frequency_impulses_magnitude = max(FFT_magnitude) * 5
-        sampling_frequency_impulses = [-reconstruction_sampling_frequency / 2, reconstruction_sampling_frequency / 2]
-        sampling_frequency_to_plot = []
-        sampling_magnitude_to_plot = []
-        if show_repetitions:
-            for freq in sampling_frequency_impulses:
-                for n in range(-2, 3):  # Repeat around the sampling frequency
-                    sampling_frequency_to_plot.append(freq + n * reconstruction_sampling_frequency)
-                    sampling_magnitude_to_plot.append(sampling_frequency_impulses_magnitude)
-        else:
-            sampling_frequency_to_plot = sampling_frequency_impulses
-            sampling_magnitude_to_plot = [sampling_frequency_impulses_magnitude, sampling_frequency_impulses_magnitude]
-        self.draw_impulses(sampling_magnitude_to_plot, sampling_frequency_to_plot, pen=self.sampling_frequency_pen)
+    def draw_spectrum(self, FFT_magnitude, frequency_bins, reconstruction_sampling_frequency, show_repetitions=False):
+        """Plots an already computed DFT magnitude, e.g. one computed off the UI thread."""
+        self.FFT_magnitude = FFT_magnitude
+        self.frequency_bins = frequency_bins
+        self.reconstruction_sampling_frequency = reconstruction_sampling_frequency
 
         # Draw original signal components
-        self.draw_impulses(FFT_magnitude, frequency_bins, self.original_pen)
-
-        # Show repetitions if requested
-        if show_repetitions:
-            repeated_frequencies = []
-            repeated_magnitudes = []
+        self.draw_impulses(self.original_item, FFT_magnitude, frequency_bins)
+        self.set_show_repetitions(show_repetitions)
 
-            # Iterate through original frequencies and repeat them
-            for freq, magnitude in zip(frequency_bins, FFT_magnitude):
-                if magnitude > 20:  # Only consider significant magnitudes
-                    # Repeat frequency three times at intervals of sampling frequency
-                    for n in range(-2, 3):  # Repeat around the original frequency
-                        repeated_frequencies.append(freq + n * reconstruction_sampling_frequency)
-                        repeated_magnitudes.append(magnitude)
+    def set_show_repetitions(self, show_repetitions):
+        """Redraws the sampling frequency impulses and the repetitions of the last drawn spectrum."""
+        sampling_frequency = self.reconstruction_sampling_frequency
 
-            # Draw perceived repetitions
-            self.draw_impulses(repeated_magnitudes, repeated_frequencies, self.repetition_pen)
-
-        # Show the legend
-        self.legend.show()
-
-    def compute_FFT(self, data_points, og_sampling_period):
-        fft = np.fft.fft(data_points)
-        frequency_bins = np.fft.fftfreq(len(data_points), og_sampling_period)
+        # Draw sampling frequency impulses
+        sampling_frequency_impulses_magnitude = (np.max(self.FFT_magnitude) if len(self.FFT_magnitude) else 1) * 5
+        sampling_frequency_impulses = np.array([-sampling_frequency / 2, sampling_frequency / 2])
+        if show_repetitions:
+            # Repeat around the sampling frequency
+            sampling_frequency_impulses = (sampling_frequency_impulses[:, np.newaxis] +
+                                           DFTGraph.REPETITIONS * sampling_frequency).ravel()
+        self.draw_impulses(self.sampling_frequency_item,
+                           np.full(len(sampling_frequency_impulses), sampling_frequency_impulses_magnitude),
+                           sampling_frequency_impulses)
 
-        magnitude = np.abs(fft)
+        # Show repetitions if requested
+        if show_repetitions:
+            significant = self.FFT_magnitude > 20  # Only consider significant magnitudes
+            # Repeat every significant frequency at intervals of the sampling frequency
+            repeated_frequencies = (self.frequency_bins[significant][:, np.newaxis] +
+                                    DFTGraph.REPETITIONS * sampling_frequency).ravel()
+            repeated_magnitudes = np.repeat(self.FFT_magnitude[significant], len(DFTGraph.REPETITIONS))
+            self.draw_impulses(self.repetition_item, repeated_magnitudes, repeated_frequencies)
+            if not self.repetitions_in_legend:
+                self.legend.addItem(self.repetition_item, "Perceived Repetition")
+        else:
+            self.draw_impulses(self.repetition_item, np.empty(0), np.empty(0))
+            if self.repetitions_in_legend:
+                self.legend.removeItem(self.repetition_item)
+        self.repetitions_in_legend = show_repetitions
+
+    @staticmethod
+    def compute_FFT(data_points, og_sampling_period):
+        """
+        Magnitude of the DFT bins above the display threshold, over negative and positive frequencies.
+
+        The input is real, so only the rfft half is computed and mirrored. Spectra of the most recent inputs
+        are cached, keyed by the input's contents.
+        """
+        data_points = np.ascontiguousarray(data_points, dtype=Precision.dtype)
+        key = (len(data_points), data_points.dtype.str, og_sampling_period,
+               hashlib.blake2b(data_points, digest_size=16).digest())
+        if key in DFTGraph.spectrum_cache:
+            DFTGraph.spectrum_cache.move_to_end(key)
+            return DFTGraph.spectrum_cache[key]
+
+        with Profiler.span("fft"):
+            spectrum = DFTGraph.magnitude_spectrum(data_points, og_sampling_period)
+        DFTGraph.spectrum_cache[key] = spectrum
+        if len(DFTGraph.spectrum_cache) > DFTGraph.MAX_CACHED_SPECTRA:
+            DFTGraph.spectrum_cache.popitem(last=False)
+        return spectrum
+
+    @staticmethod
+    def magnitude_spectrum(data_points, og_sampling_period):
+        magnitude = np.abs(np.fft.rfft(data_points))
+        frequency_bins = np.fft.rfftfreq(len(data_points), og_sampling_period)
 
         above_threshold = magnitude > 5
         filtered_magnitudes = magnitude[above_threshold]
         filtered_frequencies = frequency_bins[above_threshold]
-        return filtered_magnitudes, filtered_frequencies
-
-    def draw_impulses(self, magnitudes, frequencies, pen):
-        if pen == self.original_pen:
-            name = "Original Signal Components"
-        elif pen == self.repetition_pen:
-            name = "Perceived Repetition"
-        else:
-            name = "Sampling Frequency"
-
-        # Create impulse data for drawing
-        x_data = np.repeat(frequencies, 3)
-        y_data = np.zeros_like(x_data)
-        y_data[1::3] = magnitudes
-
-        impulse_item = pg.PlotDataItem(x=x_data, y=y_data, pen=pen)
-
-        # Add item to the plot
-        self.DFT_plot_widget.addItem(impulse_item)
 
-        # Add item to the legend
-        self.legend.addItem(impulse_item, name)
+        # Mirror every bin but DC (and the Nyquist bin of even lengths) to the negative frequencies
+        mirrored = (filtered_frequencies > 0) & ~((len(data_points) % 2 == 0) &
+                                                  (np.arange(len(magnitude))[above_threshold] == len(magnitude) - 1))
+        spectrum = (np.concatenate([filtered_magnitudes[mirrored][::-1], filtered_magnitudes]),
+                    np.concatenate([-filtered_frequencies[mirrored][::-1], filtered_frequencies]))
+        return spectrum
+
+    @staticmethod
+    def draw_impulses(item, magnitudes, frequencies):
+        # Create impulse data for drawing, one segment per impulse
+        x_data = np.repeat(frequencies, 2)
+        y_data = np.zeros_like(x_data, dtype=np.float64)
+        y_data[1::2] = magnitudes
+        item.setData(x=x_data, y=y_data)
@@ -0,0 +1,238 @@
+import time
+
+import numpy as np
+
+from SignalReconstruction import SignalReconstruction, ReconstructionCache
+
+
+class RingBuffer:
+    """
+    Fixed-capacity FIFO of float64 rows, one value per column.
+
+    Every row is written twice, `capacity` apart, so the buffered rows are always one contiguous slice and view()
+    needs no copy.
+    """
+
+    def __init__(self, capacity, columns=1):
+        self.capacity = capacity
+        self.data = np.zeros((columns, 2 * capacity))
+        self.start = 0
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def clear(self):
+        self.start = 0
+        self.length = 0
+
+    def view(self):
+        """:return: (columns x rows) view of the buffered rows, oldest first."""
+        return self.data[:, self.start:self.start + self.length]
+
+    def extend(self, block):
+        """
+        Appends a (columns x rows) block, dropping the oldest rows once full.
+
+        :return: (columns x rows) copy of the rows that were dropped.
+        """
+        block = np.asarray(block, dtype=np.float64)
+        count = block.shape[1]
+        dropped_count = max(self.length + count - self.capacity, 0)
+        if dropped_count <= self.length:
+            dropped = self.view()[:, :dropped_count].copy()
+        else:
+            dropped = np.concatenate([self.view(), block[:, :dropped_count - self.length]], axis=1)
+        if count > self.capacity:
+            block = block[:, -self.capacity:]
+            count = self.capacity
+
+        position = (self.start + self.length) % self.capacity
+        first = min(count, self.capacity - position)
+        for offset in (0, self.capacity):
+            self.data[:, position + offset:position + offset + first] = block[:, :first]
+            self.data[:, offset:offset + count - first] = block[:, first:]
+
+        self.length = min(self.length + count, self.capacity)
+        self.start = (position + count - self.length) % self.capacity
+        return dropped
+
+
+class SampleSource:
+    """
+    Produces the input of the live mode at `rate` Hz, paced by the wall clock.
+
+    Subclasses implement clean_values. Noise with the given standard deviation is added on top.
+    """
+    # Longest stretch produced by one poll, a stalled UI skips ahead instead of catching up
+    MAX_POLL_SECONDS = 1.0
+
+    def __init__(self, rate, noise_deviation=0.0, seed=None):
+        self.rate = rate
+        self.noise_deviation = noise_deviation
+        self.random_generator = np.random.default_rng(seed)
+        self.start_time = None
+        self.produced = 0
+
+    def clean_values(self, indices, times):
+        raise NotImplementedError
+
+    def poll(self, now=None):
+        """
+        Returns the input acquired since the previous poll.
+
+        :return: tuple (times, noiseless values, noisy values).
+        """
+        now = time.perf_counter() if now is None else now
+        if self.start_time is None:
+            self.start_time = now
+        available = int((now - self.start_time) * self.rate) + 1
+        self.produced = max(self.produced, available - int(SampleSource.MAX_POLL_SECONDS * self.rate))
+        indices = np.arange(self.produced, available)
+        self.produced = max(available, self.produced)
+
+        times = indices / self.rate
+        clean_values = self.clean_values(indices, times)
+        noisy_values = clean_values
+        if self.noise_deviation > 0:
+            noisy_values = clean_values + self.random_generator.normal(0, self.noise_deviation, len(indices))
+        return times, clean_values, noisy_values
+
+
+class SyntheticSource(SampleSource):
+    """Evaluates a composed signal at the acquisition instants."""
+
+    def __init__(self, signal, rate, noise_deviation=0.0, seed=None):
+        super().__init__(rate, noise_deviation, seed)
+        self.signal = signal
+
+    def clean_values(self, indices, times):
+        return self.signal.signal_points(times)
+
+
+class FileReplaySource(SampleSource):
+    """Replays a file signal in a loop, at the rate of its time column unless given, as a stand-in for an ADC."""
+
+    def __init__(self, signal, rate=None, noise_deviation=0.0, seed=None):
+        if rate is None:
+            rate = 1 / np.median(np.diff(signal.plotting_linspace[:1_000]))
+        super().__init__(rate, noise_deviation, seed)
+        self.signal = signal
+
+    def clean_values(self, indices, times):
+        file_times = np.asarray(self.signal.plotting_linspace[indices % len(self.signal.plotting_linspace)])
+        return self.signal.signal_points(file_times)
+
+
+class LiveStream:
+    """
+    Samples and reconstructs the output of a SampleSource as it arrives.
+
+    The input, the samples taken at the sampling frequency and the reconstruction are kept in ring buffers
+    covering the last `window` seconds. Each update only reconstructs the new input points, from the samples around
+    them (overlap-save): a point is reconstructed once the samples its kernel reaches are in, so the reconstruction
+    lags the input by that many sampling periods. This is exact for the local kernels (zero order hold, linear,
+    nearest neighbor, windowed sinc); the sinc, cubic spline and Fourier reconstructions are computed over the
+    `taps` samples around the new points instead of the whole record.
+    """
+    # Refresh interval of the live plots, about 60 fps
+    FRAME_INTERVAL_MS = 16
+
+    # Input rate of synthetic sources
+    DEFAULT_INPUT_RATE = 1_000
+
+    # Sampling periods the kernels of the local methods reach past a point
+    LOCAL_LOOKAHEAD = {
+        SignalReconstruction.ZERO_ORDER_HOLD: 1,
+        SignalReconstruction.LINEAR: 1,
+        SignalReconstruction.NEAREST_NEIGHBOR: 1,
+    }
+
+    def __init__(self, source, sampling_frequency, method, taps=None, window=5.0):
+        self.source = source
+        self.sampling_frequency = sampling_frequency
+        self.sampling_period = 1 / sampling_frequency
+        self.method = method
+        self.taps = taps or SignalReconstruction.DEFAULT_TAPS
+        self.window = window
+        self.lookahead = LiveStream.LOCAL_LOOKAHEAD.get(method, max(self.taps // 2, 1))
+        if method == SignalReconstruction.CUBIC_SPLINE:
+            # Imported now rather than within the first frame
+            SignalReconstruction.import_scipy()
+
+        input_capacity = max(int(np.ceil(window * source.rate)), 1)
+        # (time, noiseless signal, noisy signal) of the input
+        self.input = RingBuffer(input_capacity, 3)
+        # (time, value) of the samples, with room for the kernel's reach before the window
+        self.samples = RingBuffer(int(np.ceil(window * sampling_frequency)) + 2 * self.lookahead + 2, 2)
+        # (time, reconstruction, difference) of the reconstructed input points
+        self.output = RingBuffer(input_capacity, 3)
+
+        self.next_sample_index = 0
+        self.last_input = None
+        self.reconstructed_until = -np.inf
+        self.squared_error_sum = 0.0
+        # Per-update reconstructions never repeat, caching their artifacts would only fill memory
+        self.cache = ReconstructionCache(1)
+
+    def update(self, now=None):
+        """Polls the source and processes what it produced, returning the number of new input points."""
+        times, clean_values, noisy_values = self.source.poll(now)
+        if len(times) == 0:
+            return 0
+        self.input.extend(np.vstack([times, clean_values, noisy_values]))
+        self.take_samples(times, noisy_values)
+        self.reconstruct_new_points()
+        return len(times)
+
+    def take_samples(self, times, values):
+        """Samples the new input at the multiples of the sampling period it covers."""
+        if self.last_input is not None:
+            times = np.concatenate([[self.last_input[0]], times])
+            values = np.concatenate([[self.last_input[1]], values])
+        self.last_input = (times[-1], values[-1])
+
+        last_sample_index = int(np.floor(times[-1] * self.sampling_frequency + 1e-9))
+        sample_indices = np.arange(max(self.next_sample_index, int(np.ceil(times[0] * self.sampling_frequency))),
+                                   last_sample_index + 1)
+        if len(sample_indices) == 0:
+            return
+        sample_times = sample_indices * self.sampling_period
+        self.samples.extend(np.vstack([sample_times, np.interp(sample_times, times, values)]))
+        self.next_sample_index = last_sample_index + 1
+
+    def reconstruct_new_points(self):
+        sample_times, sample_values = self.samples.view()
+        if len(sample_times) < 2:
+            return
+        # Points whose kernel reaches no sample that is yet to come
+        limit = sample_times[-1] - self.lookahead * self.sampling_period
+        input_times, clean_values, _ = self.input.view()
+        start = np.searchsorted(input_times, self.reconstructed_until, side='right')
+        stop = np.searchsorted(input_times, limit, side='right')
+        if stop <= start:
+            return
+
+        timespace = input_times[start:stop]
+        first_sample = np.searchsorted(sample_times, timespace[0] - (self.lookahead + 1) * self.sampling_period)
+        window_times = sample_times[first_sample:]
+        window_values = sample_values[first_sample:]
+        if len(window_times) < 2:
+            return
+        reconstruction = SignalReconstruction(window_values, self.sampling_frequency, timespace, taps=self.taps,
+                                              cache=self.cache, sample_times=window_times)
+        reconstructed = reconstruction.reconstruct_signal(self.method)
+        difference = clean_values[start:stop] - reconstructed
+
+        dropped = self.output.extend(np.vstack([timespace, reconstructed, difference]))
+        self.squared_error_sum += np.sum(difference ** 2) - np.sum(dropped[2] ** 2)
+        self.reconstructed_until = timespace[-1]
+
+    def rmse(self):
+        """Root mean squared difference over the reconstructed points in the window."""
+        if len(self.output) == 0:
+            return 0.0
+        return float(np.sqrt(max(self.squared_error_sum, 0.0) / len(self.output)))
+
+    def latest_time(self):
+        return self.input.view()[0, -1] if len(self.input) else 0.0
@@ -0,0 +1,153 @@
+"""
+Distribution of the reconstruction error over many noise realizations.
+
+K unit power noise realizations are drawn from a seeded generator on the studio's noise grid and interpolated at the
+sample instants, as Signal.noise_points does, into one (K x samples) block. Every reconstruction method is linear in
+the samples, so the noiseless samples are reconstructed once and the noise block in one batched pass; the K
+reconstructions at any SNR are then the noiseless one plus the scaled noise ones. The RMSE over the displayed
+linspace is summarized per SNR by its mean, standard deviation and percentiles.
+
+Usage:
+    python NoiseEnsemble.py Scenarios/test1.dsp --realizations 1000 --snrs 0,10,20,30 --seed 7 --output ensemble.csv
+"""
+import argparse
+
+import numpy as np
+
+from ParameterSweep import ALL_METHODS, parse_range, save_table
+from ScenarioArchive import ScenarioArchive
+from SignalClasses import Signal
+from SignalReconstruction import SignalReconstruction
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Upper bound on one (realizations x time points) block of reconstructions
+MAX_BLOCK_BYTES = 64 * 1024 ** 2
+
+
+def noise_block(signal, sample_times, realizations, seed=None):
+    """
+    Draws unit power noise realizations the way the studio draws the signal's own one, at the given instants.
+
+    Each realization is white noise over signal.noise_linspace, linearly interpolated at the sample instants like
+    Signal.unit_noise_points, so samples between grid points see its reduced variance as well. Only the grid points
+    around the samples are drawn, so long recordings cost no more than their samples.
+
+    :return: (realizations x samples) array.
+    """
+    grid = signal.noise_linspace
+    # Interpolation weights of np.interp, holding the end values outside the grid
+    left = np.clip(np.searchsorted(grid, sample_times, side='right') - 1, 0, len(grid) - 2)
+    weights = np.clip((sample_times - grid[left]) / (grid[left + 1] - grid[left]), 0, 1)
+    grid_points, positions = np.unique(np.concatenate([left, left + 1]), return_inverse=True)
+    left_positions, right_positions = positions[:len(left)], positions[len(left):]
+
+    random_generator = np.random.default_rng(seed)
+    noise = np.empty((realizations, len(sample_times)))
+    realizations_per_block = max(MAX_BLOCK_BYTES // (np.dtype(np.float64).itemsize * len(grid_points)), 1)
+    for start in range(0, realizations, realizations_per_block):
+        stop = min(start + realizations_per_block, realizations)
+        grid_noise = random_generator.standard_normal((stop - start, len(grid_points)))
+        noise[start:stop] = (1 - weights) * grid_noise[:, left_positions] + weights * grid_noise[:, right_positions]
+    return noise
+
+
+def sample_times_of(signal, sampling_frequency):
+    """Sample instants the studio uses for the signal at the given sampling frequency."""
+    sampling_period = 1 / sampling_frequency
+    if signal.signal_type == Signal.FROM_FILE:
+        return np.arange(signal.linspace_start, signal.linspace_stop, sampling_period)
+    return np.arange(signal.complete_linspace_start, signal.complete_linspace_stop, sampling_period)
+
+
+def ensemble_rmse(signal, sampling_frequency, method, SNRs, noise, taps=None, plotting_linspace=None):
+    """
+    RMSE of the reconstruction over the plotting linspace, for every SNR and noise realization.
+
+    :param SNRs: SNR values in dB, None standing for no noise.
+    :param noise: (realizations x samples) unit power noise at the sample instants, see noise_block.
+    :return: (SNRs x realizations) array of RMSEs.
+    """
+    if plotting_linspace is None:
+        plotting_linspace = np.linspace(0, 5, 5_000)
+    sample_times = sample_times_of(signal, sampling_frequency)
+    samples = signal.signal_points(sample_times)
+    signal_power = signal.signal_power()
+    noise_scales = np.array([0.0 if SNR is None else np.sqrt(signal_power / (10 ** (SNR / 10))) for SNR in SNRs])
+
+    def reconstruct(block):
+        return SignalReconstruction(block, sampling_frequency, plotting_linspace, taps=taps,
+                                    sample_times=sample_times).reconstruct_signal(method)
+
+    noiseless_error = reconstruct(samples) - signal.signal_points(plotting_linspace)
+    rmse = np.empty((len(SNRs), len(noise)))
+    realizations_per_block = max(MAX_BLOCK_BYTES // (np.dtype(np.float64).itemsize * len(plotting_linspace)), 1)
+    for start in range(0, len(noise), realizations_per_block):
+        stop = min(start + realizations_per_block, len(noise))
+        noise_reconstructions = reconstruct(noise[start:stop])
+        for SNR_index, noise_scale in enumerate(noise_scales):
+            error = noiseless_error + noise_scale * noise_reconstructions
+            rmse[SNR_index, start:stop] = np.sqrt(np.mean(error ** 2, axis=1))
+    return rmse
+
+
+def ensemble(signal, sampling_frequencies, methods=ALL_METHODS, SNRs=(None,), realizations=200, seed=None,
+             taps=None, percentiles=DEFAULT_PERCENTILES, plotting_linspace=None):
+    """
+    Summarizes the RMSE distribution for every combination of sampling frequency, method and SNR.
+
+    The noise realizations only depend on the seed, so every sampling frequency, method and SNR sees the same ones,
+    as the studio samples its one realization at any frequency.
+
+    :return: dict of equally long columns: sampling_frequency, method, SNR (nan without noise), realizations,
+             rmse_mean, rmse_std and one rmse_p<percentile> column per percentile.
+    """
+    table = {"sampling_frequency": [], "method": [], "SNR": [], "realizations": [], "rmse_mean": [], "rmse_std": []}
+    for percentile in percentiles:
+        table[f"rmse_p{percentile:g}"] = []
+
+    for sampling_frequency in sampling_frequencies:
+        noise = noise_block(signal, sample_times_of(signal, sampling_frequency), realizations, seed)
+        for method in methods:
+            rmse = ensemble_rmse(signal, sampling_frequency, method, SNRs, noise, taps, plotting_linspace)
+            rmse_percentiles = np.percentile(rmse, percentiles, axis=1)
+            for SNR_index, SNR in enumerate(SNRs):
+                table["sampling_frequency"].append(sampling_frequency)
+                table["method"].append(method)
+                table["SNR"].append(np.nan if SNR is None else SNR)
+                table["realizations"].append(realizations)
+                table["rmse_mean"].append(np.mean(rmse[SNR_index]))
+                table["rmse_std"].append(np.std(rmse[SNR_index]))
+                for percentile, values in zip(percentiles, rmse_percentiles):
+                    table[f"rmse_p{percentile:g}"].append(values[SNR_index])
+    return {column: np.array(values) for column, values in table.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RMSE distribution over noise realizations, per SNR.")
+    parser.add_argument("scenario", help=".dsp or .dspz scenario file providing the signal")
+    parser.add_argument("--frequencies", default=None,
+                        help="sampling frequencies, start:stop:step or a list (default: the scenario's)")
+    parser.add_argument("--methods", default=None,
+                        help="comma separated SignalReconstruction method ids (default: the scenario's)")
+    parser.add_argument("--snrs", default="0,10,20,30", help="comma separated SNRs in dB, 'none' for no noise")
+    parser.add_argument("--realizations", type=int, default=200, help="number of noise realizations")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the noise realizations")
+    parser.add_argument("--taps", type=int, default=None, help="taps of the windowed sinc")
+    parser.add_argument("--output", default="ensemble.csv", help=".csv or .npz output file")
+    args = parser.parse_args(argv)
+
+    state_data, signal = ScenarioArchive.read(args.scenario, mapped=True)
+    frequencies = [state_data['sampling']['frequency']] if args.frequencies is None else parse_range(args.frequencies)
+    methods = [state_data['reconstruction_method']] if args.methods is None else \
+        [int(method) for method in args.methods.split(",")]
+    SNRs = [None if value.strip().lower() == "none" else float(value) for value in args.snrs.split(",")]
+
+    table = ensemble(signal, frequencies, methods, SNRs, args.realizations, args.seed,
+                     args.taps or state_data.get('sinc_taps'))
+    save_table(table, args.output)
+    print(f"Wrote {len(table['rmse_mean'])} rows over {args.realizations} realizations to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Reconstruction error over a grid of sampling frequencies x reconstruction methods x SNRs.
+
+The signal is synthesized once, and so is the noise: every reconstruction method is linear in the samples, so the
+reconstruction of noiseless samples and of unit-power noise samples are computed once per (sampling frequency,
+method) and combined for every SNR. The (sampling frequency, method) pairs are spread over a process pool.
+
+Usage:
+    python ParameterSweep.py Scenarios/test1.dsp --frequencies 2:100:2 --snrs 5,10,20,none --output sweep.npz
+"""
+import argparse
+import csv
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ScenarioArchive import ScenarioArchive
+from SignalClasses import Signal
+from SignalReconstruction import SignalReconstruction
+
+ALL_METHODS = (SignalReconstruction.ZERO_ORDER_HOLD, SignalReconstruction.LINEAR, SignalReconstruction.NYQUIST,
+               SignalReconstruction.CUBIC_SPLINE, SignalReconstruction.FOURIER, SignalReconstruction.NEAREST_NEIGHBOR,
+               SignalReconstruction.WINDOWED_SINC)
+
+# Grid shared by the worker processes, set once per process by set_worker_grid
+worker_grid = {}
+
+
+def set_worker_grid(complete_linspace, plotting_linspace, complete_reference, plotting_reference, in_span):
+    # The pool already runs a process per core, reconstruction threads on top of it would oversubscribe them
+    SignalReconstruction.set_workers(1)
+    SignalReconstruction.import_scipy()
+    worker_grid.update(complete_linspace=complete_linspace, plotting_linspace=plotting_linspace,
+                       complete_reference=complete_reference, plotting_reference=plotting_reference,
+                       in_span=in_span)
+
+
+def sweep_point(sampling_frequency, method, sample_times, samples, noise_samples, noise_scales, taps):
+    """
+    Reconstructs the noiseless samples and the unit noise samples, and derives the error for every noise scale.
+
+    :return: tuple (rmse over the plotting linspace, rmse over the sampled span, reconstruction seconds), the
+             rmse arrays having one entry per noise scale.
+    """
+    complete_linspace = worker_grid["complete_linspace"]
+    start = time.perf_counter()
+    signal_reconstruction = SignalReconstruction(samples, sampling_frequency, complete_linspace, taps=taps,
+                                                 sample_times=sample_times).reconstruct_signal(method)
+    noise_reconstruction = SignalReconstruction(noise_samples, sampling_frequency, complete_linspace, taps=taps,
+                                                sample_times=sample_times).reconstruct_signal(method)
+    elapsed = (time.perf_counter() - start) / 2
+
+    # (noise scales x points) reconstructions, one row per SNR
+    reconstructions = signal_reconstruction + np.multiply.outer(noise_scales, noise_reconstruction)
+    complete_error = reconstructions[:, worker_grid["in_span"]] - worker_grid["complete_reference"]
+    plotting_reconstructions = np.array([np.interp(worker_grid["plotting_linspace"], complete_linspace, row)
+                                         for row in reconstructions])
+    plotting_error = plotting_reconstructions - worker_grid["plotting_reference"]
+    return (np.sqrt(np.mean(plotting_error ** 2, axis=1)), np.sqrt(np.mean(complete_error ** 2, axis=1)),
+            elapsed)
+
+
+def sweep(signal, sampling_frequencies, methods=ALL_METHODS, SNRs=(None,), taps=None, workers=None,
+          plotting_linspace=None):
+    """
+    Evaluates the reconstruction error for every combination of the given grids.
+
+    :param SNRs: SNR values in dB, None standing for no noise.
+    :return: dict of equally long columns: sampling_frequency, method, SNR (nan without noise), rmse (over the
+             plotting linspace), rmse_complete (over the sampled span) and reconstruction_seconds.
+    """
+    if plotting_linspace is None:
+        plotting_linspace = np.linspace(0, 5, 5_000)
+    complete_linspace = signal.sampling_origin_linspace
+    start_time, stop_time = signal.time_bounds()
+    in_span = (complete_linspace >= start_time) & (complete_linspace <= stop_time)
+    complete_reference = signal.signal_points(complete_linspace[in_span])
+    plotting_reference = signal.signal_points(plotting_linspace)
+
+    # Noise scales relative to the unit power base noise, one per SNR
+    signal_power = signal.signal_power()
+    noise_scales = np.array([0.0 if SNR is None else np.sqrt(signal_power / (10 ** (SNR / 10))) for SNR in SNRs])
+
+    points = []
+    for sampling_frequency in sampling_frequencies:
+        sampling_period = 1 / sampling_frequency
+        if signal.signal_type == Signal.FROM_FILE:
+            sample_times = np.arange(signal.linspace_start, signal.linspace_stop, sampling_period)
+        else:
+            sample_times = np.arange(signal.complete_linspace_start, signal.complete_linspace_stop, sampling_period)
+        samples = signal.signal_points(sample_times)
+        noise_samples = signal.unit_noise_points(sample_times)
+        for method in methods:
+            points.append((sampling_frequency, method, sample_times, samples, noise_samples, noise_scales, taps))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=set_worker_grid,
+                             initargs=(complete_linspace, plotting_linspace, complete_reference, plotting_reference,
+                                       in_span)) as executor:
+        point_results = list(executor.map(sweep_point, *zip(*points)))
+
+    table = {"sampling_frequency": [], "method": [], "SNR": [], "rmse": [], "rmse_complete": [],
+             "reconstruction_seconds": []}
+    for point, (rmse, rmse_complete, elapsed) in zip(points, point_results):
+        for SNR_index, SNR in enumerate(SNRs):
+            table["sampling_frequency"].append(point[0])
+            table["method"].append(point[1])
+            table["SNR"].append(np.nan if SNR is None else SNR)
+            table["rmse"].append(rmse[SNR_index])
+            table["rmse_complete"].append(rmse_complete[SNR_index])
+            table["reconstruction_seconds"].append(elapsed)
+    return {column: np.array(values) for column, values in table.items()}
+
+
+def save_table(table, file_path):
+    """Writes the sweep table as .npz columns, or as CSV if file_path ends with .csv."""
+    if file_path.endswith(".csv"):
+        with open(file_path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(table.keys())
+            writer.writerows(zip(*table.values()))
+    else:
+        np.savez(file_path, **table)
+
+
+def parse_range(text):
+    """Parses "start:stop:step" (stop included) or a comma separated list of numbers."""
+    if ":" in text:
+        start, stop, step = (float(value) for value in text.split(":"))
+        return np.arange(start, stop + step / 2, step)
+    return np.array([float(value) for value in text.split(",")])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep reconstruction error over sampling rate, method and SNR.")
+    parser.add_argument("scenario", help=".dsp or .dspz scenario file providing the signal")
+    parser.add_argument("--frequencies", default="2:100:1", help="sampling frequencies, start:stop:step or a list")
+    parser.add_argument("--methods", default=",".join(str(method) for method in ALL_METHODS),
+                        help="comma separated SignalReconstruction method ids")
+    parser.add_argument("--snrs", default="none", help="comma separated SNRs in dB, 'none' for no noise")
+    parser.add_argument("--taps", type=int, default=None, help="taps of the windowed sinc")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the noise, for reproducible runs")
+    parser.add_argument("--output", default="sweep.npz", help=".npz or .csv output file")
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        np.random.seed(args.seed)
+    _, signal = ScenarioArchive.read(args.scenario, mapped=True)
+    SNRs = [None if value.strip().lower() == "none" else float(value) for value in args.snrs.split(",")]
+    methods = [int(method) for method in args.methods.split(",")]
+
+    table = sweep(signal, parse_range(args.frequencies), methods, SNRs, args.taps, args.workers)
+    save_table(table, args.output)
+    print(f"Wrote {len(table['rmse'])} grid points to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
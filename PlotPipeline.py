@@ -0,0 +1,298 @@
+import traceback
+from collections import OrderedDict
+
+import numpy as np
+from PySide6 import QtCore
+
+from SignalReconstruction import SignalReconstruction, ViewportReconstruction, ReconstructionCache
+from DFTGraph import DFTGraph
+from Precision import Precision
+from Profiler import Profiler
+
+
+class PlotRequest:
+    """Snapshot of everything a plot update is computed from, safe to read on the worker thread."""
+    # Request kinds
+    # --------------------------------------------------------
+    FULL = 0
+    VIEWPORT = 1
+
+    def __init__(self, kind, signal=None, plotting_linspace=None, with_noise=True, sampling_frequency=1,
+                 method=SignalReconstruction.NYQUIST, taps=None, viewport=None):
+        self.kind = kind
+        self.signal = signal
+        self.plotting_linspace = plotting_linspace
+        self.with_noise = with_noise
+        self.sampling_frequency = sampling_frequency
+        self.method = method
+        self.taps = taps
+        # (x_min, x_max, pixels) of the visible range, or None to reconstruct the plotting linspace
+        self.viewport = viewport
+
+    def merged_with(self, newer_request):
+        """Combines a pending request with a newer one so that neither's changes are lost."""
+        if newer_request.kind == PlotRequest.VIEWPORT and self.kind == PlotRequest.FULL:
+            merged_request = self
+            merged_request.viewport = newer_request.viewport
+            return merged_request
+        return newer_request
+
+
+class PlotResult:
+    def __init__(self):
+        self.request = None
+        self.signal_linspace = None
+        self.signal_points = None
+        self.noise = None
+        # Points the noisy signal is drawn with, when it is not drawn from signal_points + noise
+        self.envelope_linspace = None
+        self.envelope_points = None
+        self.samples_linspace = None
+        self.samples = None
+        self.reconstruction = None
+        self.FFT_magnitude = None
+        self.frequency_bins = None
+        self.sinc_accuracy = None
+
+
+class PlotJobCancelled(Exception):
+    pass
+
+
+class PlotJob(QtCore.QRunnable):
+    def __init__(self, pipeline, generation, request):
+        super().__init__()
+        self.pipeline = pipeline
+        self.generation = generation
+        self.request = request
+
+    def run(self):
+        result = None
+        try:
+            with Profiler.span("pipeline/full" if self.request.kind == PlotRequest.FULL else "pipeline/viewport"):
+                result = self.pipeline.compute(self.request, lambda: self.pipeline.is_stale(self.generation))
+        except PlotJobCancelled:
+            pass
+        except Exception:
+            traceback.print_exc()
+        self.pipeline.job_finished.emit(self.generation, result)
+
+
+class PlotPipeline(QtCore.QObject):
+    """
+    Computes signal synthesis, noise, sampling, reconstruction and FFT on a worker thread.
+
+    Requests submitted while a job runs are coalesced into the latest one. A job superseded by a newer full request
+    stops at its next stage and its result is dropped. Results are emitted through result_ready on the thread the
+    pipeline lives in (the UI thread), which is the only one touching plot items.
+
+    Each stage's output is memoized under a key chaining the fingerprints of everything it depends on, so a request
+    only recomputes the stages downstream of what changed, and returning to a previous state recomputes nothing.
+    """
+    # Memory cap of the memoized stage outputs
+    STAGE_CACHE_BYTES = 128 * 1024 ** 2
+
+    # Viewport reconstructions (and their tiles) kept for recently used sample sets
+    MAXIMUM_VIEWPORT_RECONSTRUCTIONS = 4
+
+    result_ready = QtCore.Signal(object)
+    job_finished = QtCore.Signal(int, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # A single worker keeps the jobs ordered and the state below confined to it
+        self.thread_pool = QtCore.QThreadPool()
+        self.thread_pool.setMaxThreadCount(1)
+        # Incremented on every full request, jobs started before the latest one are stale
+        self.generation = 0
+        self.pending_request = None
+        self.running = False
+        self.job_finished.connect(self.on_job_finished)
+
+        # Inputs of the last full job, reused by viewport jobs (only touched on the worker thread)
+        self.last_full_request = None
+        self.viewport_reconstruction = None
+        self.samples_linspace = None
+        self.samples = None
+        # Memoized stage outputs and viewport reconstructions (only touched on the worker thread)
+        self.stage_cache = ReconstructionCache(PlotPipeline.STAGE_CACHE_BYTES)
+        self.viewport_reconstructions = OrderedDict()
+
+    def submit(self, request):
+        if request.kind == PlotRequest.FULL:
+            self.generation += 1
+        if self.pending_request is not None:
+            request = self.pending_request.merged_with(request)
+        self.pending_request = request
+        if not self.running:
+            self.start_pending()
+
+    def start_pending(self):
+        request, self.pending_request = self.pending_request, None
+        self.running = True
+        self.thread_pool.start(PlotJob(self, self.generation, request))
+
+    def is_stale(self, generation):
+        return generation != self.generation
+
+    def on_job_finished(self, generation, result):
+        self.running = False
+        if result is not None and not self.is_stale(generation):
+            self.result_ready.emit(result)
+        if self.pending_request is not None:
+            self.start_pending()
+
+    def wait(self):
+        """Blocks until every submitted request has been computed and its result delivered."""
+        while self.running:
+            self.thread_pool.waitForDone()
+            QtCore.QCoreApplication.processEvents()
+
+    # Computation, runs on the worker thread
+    # --------------------------------------------------------
+    def compute(self, request, is_stale):
+        def check_stale():
+            if is_stale():
+                raise PlotJobCancelled()
+
+        if request.kind == PlotRequest.VIEWPORT:
+            if self.last_full_request is None:
+                return None
+            full_request = self.last_full_request
+            full_request.viewport = request.viewport
+            result = self.compute_viewport(full_request)
+            if result is not None:
+                result.request = request
+            return result
+
+        signal = request.signal
+        plotting_linspace = request.plotting_linspace
+        result = PlotResult()
+        result.request = request
+
+        # Keys chain the fingerprints of each stage's inputs, a change invalidates every stage downstream of it
+        signal_key = (signal.fingerprint(), plotting_linspace[0], plotting_linspace[-1], len(plotting_linspace))
+        noise_key = (signal_key, signal.noise_fingerprint(), signal.SNR if request.with_noise else None)
+        sampling_key = (noise_key, request.sampling_frequency)
+        reconstruction_key = (sampling_key, request.method, request.taps)
+
+        plot_points = self.stage("synthesis", ("synthesis", signal_key),
+                                 lambda: signal.signal_points(plotting_linspace, running_sum=True))
+        noise = self.stage("noise", ("noise", noise_key), lambda: signal.noise_points(
+            plotting_linspace, request.with_noise, self.signal_power(request)))
+        if request.with_noise and Profiler.tracing:
+            noise_power = np.sum(noise ** 2) / len(noise)
+            Profiler.counter("achieved SNR", 10 * np.log10(self.signal_power(request) / noise_power))
+        (self.samples_linspace, self.samples, plot_samples_linspace, plot_samples) = self.stage(
+            "sampling", ("sampling", sampling_key), lambda: signal.sample_points(
+                request.sampling_frequency, request.with_noise, self.signal_power(request)))
+        check_stale()
+
+        self.last_full_request = request
+        reconstruction_obj = SignalReconstruction(self.samples, request.sampling_frequency,
+                                                  signal.sampling_origin_linspace, taps=request.taps,
+                                                  sample_times=self.samples_linspace)
+        if request.method == SignalReconstruction.WINDOWED_SINC:
+            # Stored as an array so that the cache accounts for its size
+            rmse, max_error = self.stage(None, ("sinc accuracy", sampling_key, request.taps), lambda: np.array(
+                list(reconstruction_obj.windowed_sinc_accuracy().values())))
+            result.sinc_accuracy = {"rmse": float(rmse), "max_error": float(max_error)}
+        check_stale()
+
+        if request.viewport is not None:
+            self.viewport_reconstruction = self.viewport_reconstruction_for(reconstruction_key, request)
+            viewport_result = self.compute_viewport(request)
+            if viewport_result is not None:
+                result.signal_linspace = viewport_result.signal_linspace
+                result.signal_points = viewport_result.signal_points
+                result.noise = viewport_result.noise
+                result.envelope_linspace = viewport_result.envelope_linspace
+                result.envelope_points = viewport_result.envelope_points
+                result.reconstruction = viewport_result.reconstruction
+            result.samples_linspace = self.samples_linspace
+            result.samples = self.samples
+        else:
+            self.viewport_reconstruction = None
+            # returns the data points to be plotted from -7.5s to 12.5s
+            result.reconstruction = self.stage(None, ("reconstruction", reconstruction_key), lambda: Precision.values(
+                np.interp(plotting_linspace, signal.sampling_origin_linspace,
+                          reconstruction_obj.reconstruct_signal(request.method))))
+            result.signal_linspace = plotting_linspace
+            result.signal_points = plot_points
+            result.noise = noise
+            result.samples_linspace = plot_samples_linspace
+            result.samples = plot_samples
+            self.set_envelope(result, plotting_linspace[0], plotting_linspace[-1], len(plotting_linspace))
+        check_stale()
+
+        og_sampling_period = plotting_linspace[1] - plotting_linspace[0]
+        result.FFT_magnitude, result.frequency_bins = self.stage(
+            None, ("fft", noise_key), lambda: DFTGraph.compute_FFT(plot_points + noise, og_sampling_period))
+        return result
+
+    def stage(self, span_name, key, build):
+        """
+        Returns the memoized output of a stage, building it on a miss.
+
+        :param span_name: name of the Profiler span timing the build, None when the build is already timed.
+        """
+        if span_name is None:
+            return self.stage_cache.get(key, build)
+
+        def timed_build():
+            with Profiler.span(span_name):
+                return build()
+
+        return self.stage_cache.get(key, timed_build)
+
+    def signal_power(self, request):
+        """
+        Power the noise of the request is scaled to, computed once per signal rather than on every noise_points.
+
+        :return: Signal.signal_power, None when the request has no noise.
+        """
+        if not request.with_noise:
+            return None
+        signal = request.signal
+        return self.stage(None, ("signal power", signal.fingerprint()), signal.signal_power)
+
+    def viewport_reconstruction_for(self, key, request):
+        """ViewportReconstruction of the last samples, reused with its tiles when they were seen recently."""
+        if key in self.viewport_reconstructions:
+            self.viewport_reconstructions.move_to_end(key)
+            return self.viewport_reconstructions[key]
+        viewport_reconstruction = ViewportReconstruction(self.samples, request.sampling_frequency,
+                                                         self.samples_linspace, request.method, taps=request.taps)
+        self.viewport_reconstructions[key] = viewport_reconstruction
+        while len(self.viewport_reconstructions) > PlotPipeline.MAXIMUM_VIEWPORT_RECONSTRUCTIONS:
+            self.viewport_reconstructions.popitem(last=False)
+        return viewport_reconstruction
+
+    def compute_viewport(self, request):
+        """Reconstructs the visible range of the last full request, see ViewportReconstruction."""
+        if self.viewport_reconstruction is None:
+            return None
+        signal = request.signal
+        timespace, reconstruction_data = self.viewport_reconstruction.reconstruct(*request.viewport,
+                                                                                   signal.time_bounds())
+        if len(timespace) == 0:
+            return None
+
+        result = PlotResult()
+        result.request = request
+        result.signal_linspace = timespace
+        result.signal_points = signal.signal_points(timespace)
+        result.noise = signal.noise_points(timespace, request.with_noise, self.signal_power(request))
+        result.reconstruction = reconstruction_data
+        result.samples_linspace = self.samples_linspace
+        result.samples = self.samples
+        self.set_envelope(result, *request.viewport)
+        return result
+
+    def set_envelope(self, result, x_min, x_max, pixels):
+        """Draws file signals from their min/max pyramid, at the level matching the drawn range."""
+        request = result.request
+        envelope = request.signal.envelope_points(x_min, x_max, pixels, request.with_noise,
+                                                  self.signal_power(request))
+        if envelope is not None:
+            result.envelope_linspace, result.envelope_points = envelope
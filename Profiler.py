@@ -0,0 +1,112 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+
+class Span:
+    """Times one run of a named stage, see Profiler.span."""
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        Profiler.record(self.name, self.start, time.perf_counter())
+        return False
+
+
+class Profiler:
+    """
+    Named timing spans around the stages of a plot update.
+
+    Disabled by default, in which case span() returns a shared no-op context manager. Once enabled, the latest
+    latencies of every stage are kept for the status bar, and every span can also be kept as a Chrome trace event
+    (viewable in chrome://tracing or Perfetto).
+    """
+    # Number of recent runs the rolling latency of a stage is averaged over
+    WINDOW = 50
+    # Trace events kept in memory, older ones are dropped
+    MAX_TRACE_EVENTS = 1_000_000
+
+    enabled = False
+    tracing = False
+    latencies = {}
+    trace_events = deque(maxlen=MAX_TRACE_EVENTS)
+    origin = time.perf_counter()
+    lock = threading.Lock()
+    NULL_SPAN = nullcontext()
+
+    @staticmethod
+    def enable(tracing=False):
+        Profiler.enabled = True
+        Profiler.tracing = tracing
+
+    @staticmethod
+    def disable():
+        Profiler.enabled = False
+        Profiler.tracing = False
+
+    @staticmethod
+    def span(name):
+        """Context manager timing the enclosed block as the stage `name`."""
+        if not Profiler.enabled:
+            return Profiler.NULL_SPAN
+        return Span(name)
+
+    @staticmethod
+    def record(name, start, stop):
+        with Profiler.lock:
+            if name not in Profiler.latencies:
+                Profiler.latencies[name] = deque(maxlen=Profiler.WINDOW)
+            Profiler.latencies[name].append(stop - start)
+            if Profiler.tracing:
+                Profiler.trace_events.append({
+                    "name": name, "ph": "X", "pid": os.getpid(), "tid": threading.get_ident(),
+                    "ts": (start - Profiler.origin) * 1e6, "dur": (stop - start) * 1e6
+                })
+
+    @staticmethod
+    def counter(name, value):
+        """Records a value over time (e.g. the achieved SNR), shown as a counter track in the trace."""
+        if not Profiler.tracing:
+            return
+        with Profiler.lock:
+            Profiler.trace_events.append({
+                "name": name, "ph": "C", "pid": os.getpid(), "tid": threading.get_ident(),
+                "ts": (time.perf_counter() - Profiler.origin) * 1e6, "args": {"value": float(value)}
+            })
+
+    @staticmethod
+    def summary():
+        """:return: dict of stage name -> (mean, last) latency in seconds over the rolling window."""
+        with Profiler.lock:
+            return {name: (sum(durations) / len(durations), durations[-1])
+                    for name, durations in Profiler.latencies.items() if durations}
+
+    @staticmethod
+    def status_text():
+        """One line of rolling mean latencies in milliseconds, for the status bar, startup milestones aside."""
+        return "  |  ".join(f"{name} {mean * 1e3:.1f} ms" for name, (mean, _) in sorted(Profiler.summary().items())
+                            if not name.startswith("startup/"))
+
+    @staticmethod
+    def dump_trace(file_path):
+        """Writes the recorded spans in Chrome trace event format."""
+        with Profiler.lock:
+            events = list(Profiler.trace_events)
+        with open(file_path, 'w') as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+    @staticmethod
+    def clear():
+        with Profiler.lock:
+            Profiler.latencies.clear()
+            Profiler.trace_events.clear()
@@ -0,0 +1,212 @@
+import json
+import os
+import struct
+import tempfile
+import zipfile
+
+import numpy as np
+
+from SignalClasses import Signal, SignalComponent, ComponentBank
+from SignalLoader import SignalLoader
+from SignalPyramid import SignalPyramid
+
+
+class ScenarioArchive:
+    """
+    Binary scenario container (.dspz), readable alongside the JSON .dsp scenarios.
+
+    A .dspz is an uncompressed zip holding state.json (the UI state of a .dsp, without the component list) and the
+    arrays of the scenario as .npy entries: the component bank, the time and value columns and min/max pyramid of
+    file signals, and the noise realization when it was not drawn from a seed. The scenario no longer depends on
+    the CSV it was loaded from. Entries are stored 64-byte aligned, so every array can be memory-mapped in place
+    and a large recording loads without being read.
+    """
+    EXTENSION = ".dspz"
+    STATE_FILE = "state.json"
+    VERSION = 1
+
+    # Alignment of the array data within the archive
+    ALIGNMENT = 64
+    # Header id of the zip extra field padding the entries to the alignment
+    PADDING_HEADER_ID = 0xD935
+    # Size of a zip local file header without its file name and extra field
+    LOCAL_HEADER_SIZE = 30
+    # Size of the zip64 extra field written with every entry
+    ZIP64_EXTRA_SIZE = 20
+
+    @staticmethod
+    def is_archive(file_path):
+        return zipfile.is_zipfile(file_path)
+
+    # Writing
+    # --------------------------------------------------------
+    @staticmethod
+    def write_array(archive, name, array):
+        """Writes an array as a stored .npy entry whose data starts at a multiple of ALIGNMENT."""
+        name = f"{name}.npy"
+        header_offset = archive.fp.tell()
+        data_offset = (header_offset + ScenarioArchive.LOCAL_HEADER_SIZE + len(name.encode()) +
+                       ScenarioArchive.ZIP64_EXTRA_SIZE + 4)
+        padding = -data_offset % ScenarioArchive.ALIGNMENT
+
+        info = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+        info.compress_type = zipfile.ZIP_STORED
+        info.extra = struct.pack('<HH', ScenarioArchive.PADDING_HEADER_ID, padding) + bytes(padding)
+        with archive.open(info, 'w', force_zip64=True) as entry:
+            # The .npy header is itself padded to a multiple of 64 bytes
+            np.lib.format.write_array(entry, np.asarray(array), allow_pickle=False)
+
+    @staticmethod
+    def save(file_path, state_data, signal):
+        """
+        Writes a scenario and its signal's arrays, through a temporary file next to it.
+
+        :param state_data: dict of the UI state, as saved in .dsp files. A signal memory-mapped from file_path
+                           itself must be detached first, see detach.
+        """
+        state_data = dict(state_data, format={"name": "dspz", "version": ScenarioArchive.VERSION})
+        state_data['signal'] = {key: value for key, value in signal.to_dict().items() if key != "components"}
+        arrays = {
+            "components/frequencies": signal.frequency_components.frequencies,
+            "components/amplitudes": signal.frequency_components.amplitudes,
+            "components/phases": signal.frequency_components.phases,
+        }
+        if signal.noise_seed is None:
+            arrays["noise/base"] = signal.base_noise
+        if signal.signal_type == Signal.FROM_FILE:
+            arrays["signal/time"] = signal.plotting_linspace
+            arrays["signal/values"] = signal.data_points
+            state_data['signal']['pyramid'] = {"levels": len(signal.pyramid.levels), "power": signal.pyramid.power}
+            for level, level_arrays in enumerate(signal.pyramid.levels):
+                for name, array in zip(("min_times", "min_values", "max_times", "max_values"), level_arrays):
+                    arrays[f"signal/pyramid/{level}/{name}"] = array
+
+        # A unique name, so that concurrent saves do not write the same file, removed if writing fails
+        descriptor, temporary_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(os.path.abspath(file_path)))
+        os.close(descriptor)
+        try:
+            with zipfile.ZipFile(temporary_path, 'w', zipfile.ZIP_STORED) as archive:
+                archive.writestr(ScenarioArchive.STATE_FILE, json.dumps(state_data))
+                for name, array in arrays.items():
+                    ScenarioArchive.write_array(archive, name, array)
+            os.replace(temporary_path, file_path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    @staticmethod
+    def detach(signal, file_path):
+        """
+        Reads the arrays of signal memory-mapped from the archive at file_path into memory, so that the archive
+        can be replaced: Windows refuses to replace a mapped file.
+        """
+        file_path = os.path.abspath(file_path)
+        # Arrays shared between the signal and its pyramid are read once
+        copies = {}
+
+        def detached(array):
+            if not isinstance(array, np.memmap) or array.filename != file_path:
+                return array
+            if id(array) not in copies:
+                copies[id(array)] = np.array(array)
+            return copies[id(array)]
+
+        signal.base_noise = detached(signal.base_noise)
+        if signal.pyramid is not None:
+            pyramid = signal.pyramid
+            pyramid.time, pyramid.values = detached(pyramid.time), detached(pyramid.values)
+            pyramid.levels = [tuple(detached(array) for array in level) for level in pyramid.levels]
+            signal.plotting_linspace = detached(signal.plotting_linspace)
+            signal.data_points = detached(signal.data_points)
+
+    # Reading
+    # --------------------------------------------------------
+    @staticmethod
+    def map_arrays(file_path, archive):
+        """:return: dict of the archive's arrays by entry name (without .npy), memory-mapped read-only."""
+        arrays = {}
+        with open(file_path, 'rb') as file:
+            for info in archive.infolist():
+                if not info.filename.endswith(".npy"):
+                    continue
+                name = info.filename[:-len(".npy")]
+                if info.compress_type != zipfile.ZIP_STORED:
+                    with archive.open(info) as entry:
+                        arrays[name] = np.lib.format.read_array(entry, allow_pickle=False)
+                    continue
+
+                # Skip the local header, whose extra field may differ from the central directory's
+                file.seek(info.header_offset)
+                local_header = file.read(ScenarioArchive.LOCAL_HEADER_SIZE)
+                name_length, extra_length = struct.unpack('<HH', local_header[26:30])
+                file.seek(info.header_offset + ScenarioArchive.LOCAL_HEADER_SIZE + name_length + extra_length)
+                if np.lib.format.read_magic(file) == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+                else:
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+                if 0 in shape:
+                    arrays[name] = np.empty(shape, dtype=dtype)
+                else:
+                    arrays[name] = np.memmap(file_path, dtype=dtype, mode='r', offset=file.tell(), shape=shape,
+                                             order='F' if fortran_order else 'C')
+        return arrays
+
+    @staticmethod
+    def load(file_path, mapped=False):
+        """
+        Opens a .dspz scenario.
+
+        :param mapped: keep the arrays memory-mapped rather than reading them into memory. Opening is then
+                       independent of the recording length, but the archive stays open as long as the signal
+                       lives: detach the signal before saving it back over the same path.
+        :return: tuple (UI state dict, as loaded from .dsp files, Signal).
+        """
+        with zipfile.ZipFile(file_path, 'r') as archive:
+            state_data = json.loads(archive.read(ScenarioArchive.STATE_FILE))
+            arrays = ScenarioArchive.map_arrays(file_path, archive)
+        if not mapped:
+            arrays = {name: np.array(array) for name, array in arrays.items()}
+        signal_dict = state_data['signal']
+
+        if signal_dict["signal_type"] == Signal.FROM_FILE:
+            time, values = arrays["signal/time"], arrays["signal/values"]
+            levels = [tuple(arrays[f"signal/pyramid/{level}/{name}"]
+                            for name in ("min_times", "min_values", "max_times", "max_values"))
+                      for level in range(signal_dict["pyramid"]["levels"])]
+            signal = Signal.from_arrays(time, values,
+                                        SignalPyramid(time, values, levels, signal_dict["pyramid"]["power"]))
+            signal.file_path = signal_dict["file_path"]
+            # The embedded arrays are identified by the archive they were read from
+            signal.file_stamp = dict(SignalLoader.source_stamp(file_path), archive=os.path.abspath(file_path))
+        else:
+            signal = Signal()
+            signal.signal_type = signal_dict["signal_type"]
+            signal.plotting_linspace = np.linspace(signal_dict["plotting_linspace"]["start"],
+                                                   signal_dict["plotting_linspace"]["stop"],
+                                                   signal_dict["plotting_linspace"]["len"])
+
+        # The bank is small and edited by replacing its arrays, so it is always read into memory
+        signal.frequency_components = ComponentBank()
+        signal.frequency_components.frequencies = np.array(arrays["components/frequencies"])
+        signal.frequency_components.amplitudes = np.array(arrays["components/amplitudes"])
+        signal.frequency_components.phases = np.array(arrays["components/phases"])
+        signal.active_component = SignalComponent(**signal_dict["active_component"])
+        if signal_dict.get("noise_seed") is not None:
+            signal.set_noise_seed(signal_dict["noise_seed"])
+        elif "noise/base" in arrays:
+            signal.base_noise = arrays["noise/base"]
+        return state_data, signal
+
+    @staticmethod
+    def read(file_path, mapped=False):
+        """
+        Opens a scenario in either format, telling them apart by their contents.
+
+        :param mapped: see load, for .dspz scenarios.
+        :return: tuple (UI state dict, Signal, None if its file could not be loaded).
+        """
+        if ScenarioArchive.is_archive(file_path):
+            return ScenarioArchive.load(file_path, mapped)
+        with open(file_path, 'r') as file:
+            state_data = json.load(file)
+        return state_data, Signal.from_dict(state_data['signal'])
@@ -0,0 +1,137 @@
+"""
+Headless batch evaluation of .dsp and .dspz scenarios.
+
+Loads every scenario without importing the Qt application, runs the Signal -> sampling -> SignalReconstruction
+pipeline as the studio does, and writes per-scenario metrics (RMSE, timings) to metrics.csv in the output
+directory, optionally with the reconstructed arrays as <scenario>.npz. Scenarios are spread over a process pool.
+
+Usage:
+    python ScenarioRunner.py Scenarios/*.dsp --output results --workers 8 --save-arrays
+"""
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ScenarioArchive import ScenarioArchive
+from SignalReconstruction import SignalReconstruction
+
+# Same displayed linspace as SamplingStudio
+PLOTTING_LINSPACE_START = 0
+PLOTTING_LINSPACE_STOP = 5
+PLOTTING_LINSPACE_LEN = 5_000
+
+METRICS_FIELDS = ["scenario", "sampling_frequency", "reconstruction_method", "SNR", "noise", "samples",
+                  "rmse", "rmse_complete", "signal_seconds", "reconstruction_seconds", "total_seconds", "error"]
+
+
+def load_scenario(file_path):
+    """:return: tuple (UI state dict, Signal), see ScenarioArchive.read. Scenarios are never saved back, so .dspz
+             arrays stay memory-mapped."""
+    return ScenarioArchive.read(file_path, mapped=True)
+
+
+def run_scenario(file_path, output_directory=None, save_arrays=False, seed=None):
+    """
+    Evaluates one scenario file.
+
+    :return: dict of metrics, see METRICS_FIELDS. Failures are reported in the "error" field.
+    """
+    scenario_name = os.path.splitext(os.path.basename(file_path))[0]
+    metrics = {"scenario": scenario_name}
+    try:
+        start = time.perf_counter()
+        # Seeded first, the unseeded noise realization is drawn while the signal is loaded
+        if seed is not None:
+            np.random.seed(seed)
+        state_data, signal = load_scenario(file_path)
+        if signal is None:
+            raise ValueError(f"Could not load the signal of {file_path}")
+        signal.SNR = state_data['Noise']['SNR']
+        with_noise = state_data['Noise']['show']
+        sampling_frequency = state_data['sampling']['frequency']
+        method = state_data['reconstruction_method']
+        metrics.update({"sampling_frequency": sampling_frequency, "reconstruction_method": method,
+                        "SNR": signal.SNR, "noise": with_noise})
+
+        plotting_linspace = np.linspace(PLOTTING_LINSPACE_START, PLOTTING_LINSPACE_STOP, PLOTTING_LINSPACE_LEN)
+        data_points_object = signal.get_data_points(plotting_linspace, with_noise, sampling_frequency)
+        signal_done = time.perf_counter()
+
+        complete_linspace = data_points_object.complete_linspace
+        reconstruction_obj = SignalReconstruction(data_points_object.all_samples, sampling_frequency, complete_linspace,
+                                                  taps=state_data.get('sinc_taps'),
+                                                  sample_times=data_points_object.all_samples_linspace)
+        reconstruction_data = reconstruction_obj.reconstruct_signal(method)
+        reconstruction_done = time.perf_counter()
+
+        # The displayed error, as in the difference plot, and the error over the whole sampled span
+        reconstruction_to_plot = np.interp(plotting_linspace, complete_linspace, reconstruction_data)
+        metrics["rmse"] = float(np.sqrt(np.mean((data_points_object.plot_points - reconstruction_to_plot) ** 2)))
+        start_time, stop_time = signal.time_bounds()
+        in_span = (complete_linspace >= start_time) & (complete_linspace <= stop_time)
+        complete_difference = signal.signal_points(complete_linspace[in_span]) - reconstruction_data[in_span]
+        metrics["rmse_complete"] = float(np.sqrt(np.mean(complete_difference ** 2)))
+        metrics["samples"] = len(data_points_object.all_samples)
+        metrics["signal_seconds"] = signal_done - start
+        metrics["reconstruction_seconds"] = reconstruction_done - signal_done
+        metrics["total_seconds"] = time.perf_counter() - start
+
+        if save_arrays and output_directory is not None:
+            np.savez(os.path.join(output_directory, scenario_name + ".npz"),
+                     time=complete_linspace,
+                     reconstruction=reconstruction_data,
+                     sample_times=data_points_object.all_samples_linspace,
+                     samples=data_points_object.all_samples,
+                     plotting_linspace=plotting_linspace,
+                     signal=data_points_object.plot_points,
+                     noise=data_points_object.noise)
+    except Exception as e:
+        metrics["error"] = f"{type(e).__name__}: {e}"
+    return metrics
+
+
+def set_worker_threads():
+    # The pool already runs a process per core, reconstruction threads on top of it would oversubscribe them
+    SignalReconstruction.set_workers(1)
+    SignalReconstruction.import_scipy()
+
+
+def run_scenarios(file_paths, output_directory, workers=None, save_arrays=False, seed=None):
+    """Evaluates the scenarios on a process pool and writes metrics.csv, returning the metrics in input order."""
+    os.makedirs(output_directory, exist_ok=True)
+    seeds = [None if seed is None else seed + index for index in range(len(file_paths))]
+    with ProcessPoolExecutor(max_workers=workers, initializer=set_worker_threads) as executor:
+        all_metrics = list(executor.map(run_scenario, file_paths, [output_directory] * len(file_paths),
+                                        [save_arrays] * len(file_paths), seeds))
+
+    with open(os.path.join(output_directory, "metrics.csv"), 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=METRICS_FIELDS)
+        writer.writeheader()
+        writer.writerows(all_metrics)
+    return all_metrics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate Sampling Theory Studio scenarios without a display.")
+    parser.add_argument("scenarios", nargs="+", help=".dsp or .dspz scenario files")
+    parser.add_argument("--output", default="results", help="directory for metrics.csv and the arrays")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes (default: CPU count)")
+    parser.add_argument("--save-arrays", action="store_true", help="also write the reconstructed arrays")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the noise, for reproducible runs")
+    args = parser.parse_args(argv)
+
+    all_metrics = run_scenarios(args.scenarios, args.output, args.workers, args.save_arrays, args.seed)
+    failed = [metrics for metrics in all_metrics if metrics.get("error")]
+    for metrics in failed:
+        print(f"{metrics['scenario']}: {metrics['error']}")
+    print(f"Evaluated {len(all_metrics) - len(failed)}/{len(all_metrics)} scenarios, "
+          f"metrics written to {os.path.join(args.output, 'metrics.csv')}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,13 @@
+import copy
+import hashlib
+import itertools
 import os.path
 import numpy as np
-import pandas as pd
+
+from Precision import Precision
+from Profiler import Profiler
+from SignalLoader import SignalLoader
+from SignalPyramid import SignalPyramid
 
 
 class SignalComponent:
@@ -11,7 +18,9 @@ class SignalComponent:
         self.label = f"{amplitude} * cos(2 * pi * {frequency} * t + {phase} * pi)"
 
     def get_data_points(self, linspace):
-        return self.amplitude * np.cos(2 * np.pi * self.frequency * linspace + self.phase * np.pi)
+        data_points = Precision.cosines(self.frequency, np.asarray(linspace, dtype=np.float64), self.phase * np.pi)
+        data_points *= self.amplitude
+        return data_points
 
     def to_dict(self):
         return {
@@ -21,6 +30,80 @@ class SignalComponent:
         }
 
 
+class ComponentBank:
+    """
+    Frequency components stored as contiguous frequency, amplitude and phase arrays.
+
+    Indexing and iterating yield SignalComponent objects, so the bank can be used wherever the list of
+    components was, while synthesis evaluates every component in one batched pass.
+    """
+    # Upper bound on the (components x time points) block evaluated at once
+    MAX_BLOCK_BYTES = 8 * 1024 ** 2
+
+    def __init__(self, components=()):
+        self.frequencies = np.empty(0)
+        self.amplitudes = np.empty(0)
+        self.phases = np.empty(0)
+        for component in components:
+            self.append(component)
+
+    @staticmethod
+    def as_number(value):
+        value = value.item()
+        return int(value) if value.is_integer() else value
+
+    def __len__(self):
+        return len(self.frequencies)
+
+    def __getitem__(self, index):
+        return SignalComponent(ComponentBank.as_number(self.frequencies[index]),
+                               self.amplitudes[index].item(),
+                               self.phases[index].item())
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(self, component: SignalComponent):
+        self.frequencies = np.append(self.frequencies, component.frequency)
+        self.amplitudes = np.append(self.amplitudes, component.amplitude)
+        self.phases = np.append(self.phases, component.phase)
+
+    def index(self, component: SignalComponent):
+        matches = np.flatnonzero((self.frequencies == component.frequency) &
+                                 (self.amplitudes == component.amplitude) &
+                                 (self.phases == component.phase))
+        if len(matches) == 0:
+            raise ValueError("Component is not in the bank.")
+        return matches[0]
+
+    def remove(self, component: SignalComponent):
+        index = self.index(component)
+        self.frequencies = np.delete(self.frequencies, index)
+        self.amplitudes = np.delete(self.amplitudes, index)
+        self.phases = np.delete(self.phases, index)
+
+    def to_dict(self):
+        return [component.to_dict() for component in self]
+
+    def get_data_points(self, linspace):
+        """Evaluates the sum of all components over linspace, a block of time points at a time."""
+        linspace = np.asarray(linspace)
+        data_points = Precision.zeros(len(linspace))
+        if len(self) == 0:
+            return data_points
+
+        points_per_block = max(ComponentBank.MAX_BLOCK_BYTES // (Precision.cosine_bytes() * len(self)), 1)
+        frequencies = self.frequencies[:, np.newaxis]
+        phases = self.phases[:, np.newaxis] * np.pi
+        amplitudes = Precision.values(self.amplitudes)
+        for start in range(0, len(linspace), points_per_block):
+            points = linspace[np.newaxis, start:start + points_per_block]
+            # Not kept in a variable, the previous block would stay alive while the next one is evaluated
+            data_points[start:start + points_per_block] = amplitudes @ Precision.cosines(frequencies, points, phases)
+        return data_points
+
+
 class DataPointsObject:
     def __init__(self):
         self.plot_points = None
@@ -28,6 +111,7 @@ class DataPointsObject:
         self.all_samples = None
         self.plot_samples = None
         self.plot_samples_linspace = None
+        self.all_samples_linspace = None
         self.complete_linspace = None
 
 
@@ -38,10 +122,19 @@ class Signal:
 
     MAXIMUM_SNR = 100
 
+    # Number of linspaces the committed components' running sum is kept up to date on
+    MAXIMUM_CACHED_LINSPACES = 4
+
+    # Numbers the unseeded noise realizations, so that fingerprints tell them apart
+    noise_draws = itertools.count()
+
+    # Points per second of the grid the noise realization is drawn on
+    NOISE_RATE = 2_000
+
     # Initializing new objects
     # --------------------------------------------------------
     def __init__(self):
-        self.frequency_components = []
+        self.frequency_components = ComponentBank()
         self.signal_type = None
         self.linspace_start = 0
         self.linspace_stop = 5
@@ -50,20 +143,32 @@ class Signal:
         self.SNR = Signal.MAXIMUM_SNR
         self.active_component = SignalComponent(2, 1, 0)
         self.file_path = None
+        # Size and modification time of the loaded file, see SignalLoader.source_stamp
+        self.file_stamp = None
+        # Min/max pyramid over the file's data, built once per loaded file
+        self.pyramid = None
         self.complete_linspace_start = -10
         self.complete_linspace_stop = 15
-        self.complete_linspace_len = (self.complete_linspace_stop - self.complete_linspace_start) * 2_000
+        self.complete_linspace_len = (self.complete_linspace_stop - self.complete_linspace_start) * Signal.NOISE_RATE
         self.sampling_origin_linspace = np.linspace(self.complete_linspace_start,
                                                     self.complete_linspace_stop,
                                                     self.complete_linspace_len)
+        # Grid of the noise realization, extended over the span of longer file signals (see cover_noise_span)
+        self.noise_linspace = self.sampling_origin_linspace
+        # Seed of the noise realization, None drawing it from NumPy's global generator
+        self.noise_seed = None
+        self.noise_draw = next(Signal.noise_draws)
         self.base_noise = np.random.normal(0, 1, self.complete_linspace_len)
+        # Running sums of the committed frequency components, keyed by the id of the linspace they are evaluated on
+        self.components_sums = {}
 
     def to_dict(self):
         return {
-            "components": [component.to_dict() for component in self.frequency_components],
+            "components": self.frequency_components.to_dict(),
             "active_component": self.active_component.to_dict(),
             "file_path": self.file_path,
             "signal_type": self.signal_type,
+            "noise_seed": self.noise_seed,
             "plotting_linspace": {
                 "start": self.plotting_linspace[0],
                 "stop": self.plotting_linspace[-1],
@@ -71,6 +176,44 @@ class Signal:
             }
         }
 
+    def snapshot(self, linspaces=()):
+        """
+        Copy of the signal that can be read on another thread while this one keeps being edited.
+
+        :param linspaces: linspaces whose running component sums should be set up on this signal first, so that
+                          later snapshots share the incremental updates instead of recomputing them.
+        """
+        for linspace in linspaces:
+            self.committed_components_sum(linspace)
+        signal_copy = copy.copy(self)
+        # The bank's arrays are replaced on every edit, never written in place, so a shallow copy is enough
+        signal_copy.frequency_components = copy.copy(self.frequency_components)
+        signal_copy.active_component = SignalComponent(self.active_component.frequency,
+                                                       self.active_component.amplitude,
+                                                       self.active_component.phase)
+        signal_copy.components_sums = {key: (linspace, components_sum.copy())
+                                       for key, (linspace, components_sum) in self.components_sums.items()}
+        return signal_copy
+
+    def fingerprint(self):
+        """
+        Digest of everything the noiseless signal depends on: the components, the active component and the file.
+
+        Cheap enough to be computed on every update, it keys the cached results of the plot pipeline.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for array in (self.frequency_components.frequencies, self.frequency_components.amplitudes,
+                      self.frequency_components.phases):
+            digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+        digest.update(repr((self.active_component.frequency, self.active_component.amplitude,
+                            self.active_component.phase, self.signal_type, self.file_path, self.file_stamp,
+                            self.linspace_start, self.linspace_stop, len(self.plotting_linspace))).encode())
+        return digest.digest()
+
+    def noise_fingerprint(self):
+        """Identifies the unit power noise realization: its seed, or the draw it came from."""
+        return ("seed", self.noise_seed) if self.noise_seed is not None else ("draw", self.noise_draw)
+
     @staticmethod
     def from_dict(signal_dict):
         if signal_dict["file_path"]:
@@ -78,32 +221,43 @@ class Signal:
             new_signal = Signal.from_file(complete_path)
         else:
             new_signal = Signal()
-        new_signal.frequency_components = [SignalComponent(**component) for component in signal_dict["components"]]
+        new_signal.frequency_components = ComponentBank(SignalComponent(**component)
+                                                        for component in signal_dict["components"])
+        new_signal.components_sums.clear()
         new_signal.active_component = SignalComponent(**signal_dict["active_component"])
         new_signal.signal_type = signal_dict["signal_type"]
         linspace_start = signal_dict["plotting_linspace"]["start"]
         linspace_stop = signal_dict["plotting_linspace"]["stop"]
         linspace_len = signal_dict["plotting_linspace"]["len"]
         new_signal.plotting_linspace = np.linspace(linspace_start, linspace_stop, linspace_len)
+        if signal_dict.get("noise_seed") is not None:
+            new_signal.set_noise_seed(signal_dict["noise_seed"])
         return new_signal
 
     @staticmethod
-    def from_file(file_path):
-        # Read signal data from file
+    def from_arrays(time, values, pyramid=None):
+        """
+        File signal over the given time and value columns, which may be memory-mapped.
+
+        :param pyramid: SignalPyramid of the columns, built when not given.
+        """
         new_signal = Signal()
         new_signal.signal_type = Signal.FROM_FILE
+        new_signal.plotting_linspace, new_signal.data_points = time, values
+        new_signal.pyramid = pyramid if pyramid is not None else SignalPyramid(time, values)
+        new_signal.linspace_start = time[0]
+        new_signal.linspace_stop = time[-1]
+        new_signal.active_component = SignalComponent(0, 0, 0)
+        new_signal.cover_noise_span(time[0], time[-1])
+        return new_signal
 
-        # Load data from CSV
+    @staticmethod
+    def from_file(file_path, dtype=None):
+        """:param dtype: dtype the values are loaded in, the compute precision by default."""
+        # Load data from CSV, memory-mapped from its binary sidecar
         try:
-            data = pd.read_csv(file_path)
-            if 'Time' not in data.columns or data.columns[1] not in data.columns:
-                raise ValueError("CSV file must contain 'Time' and a second column for signal data.")
-
-            new_signal.plotting_linspace = data['Time'].values
-            new_signal.data_points = data.iloc[:, 1].values  # Use second column as data points
-            new_signal.linspace_start = new_signal.plotting_linspace[0]
-            new_signal.linspace_stop = new_signal.plotting_linspace[-1]
-            new_signal.active_component = SignalComponent(0, 0, 0)
+            new_signal = Signal.from_arrays(*SignalLoader.load(file_path, dtype or Precision.dtype))
+            new_signal.file_stamp = SignalLoader.source_stamp(file_path)
             path_from_current_working_directory = os.path.relpath(file_path, os.getcwd())
             new_signal.file_path = path_from_current_working_directory
 
@@ -128,64 +282,204 @@ class Signal:
                                          self.active_component.amplitude,
                                          self.active_component.phase)
         self.frequency_components.append(component_copy)
+        for linspace, components_sum in self.components_sums.values():
+            components_sum += component_copy.get_data_points(linspace)
 
         # Reset the active component to default values
         self.active_component = SignalComponent(0, 0, 0)
 
     def remove_frequency_component(self, removed_component: SignalComponent):
         self.frequency_components.remove(removed_component)
+        for linspace, components_sum in self.components_sums.values():
+            if len(self.frequency_components):
+                components_sum -= removed_component.get_data_points(linspace)
+            else:
+                components_sum.fill(0)
 
-    # --------------------------------------------------------
-    def get_data_points(self, linspace, with_noise=True, sampling_frequency=1):
-        # Can change this to return the needed data points type
-        return_object = DataPointsObject()
-        if self.signal_type == Signal.FROM_FILE:
-            data_points = np.interp(linspace, self.plotting_linspace, self.data_points)
-            data_points += np.sum([component.get_data_points(linspace) for component in self.frequency_components],
-                                  axis=0)
-            if self.active_component.amplitude != 0:
-                data_points += self.active_component.get_data_points(linspace)
-            return_object.plot_points = data_points
+    def committed_components_sum(self, linspace):
+        """
+        Sum of the committed frequency components over linspace.
+
+        The sum is computed once per linspace and then kept up to date in O(len(linspace)) by
+        add_frequency_component/remove_frequency_component, so only the active component needs to be
+        evaluated on every update.
+        """
+        if id(linspace) not in self.components_sums:
+            if len(self.components_sums) >= Signal.MAXIMUM_CACHED_LINSPACES:
+                self.components_sums.pop(next(iter(self.components_sums)))
+            components_sum = self.frequency_components.get_data_points(linspace)
+            self.components_sums[id(linspace)] = (linspace, components_sum)
+        return self.components_sums[id(linspace)][1]
+
+    def composed_data_points(self, linspace, running_sum=False):
+        """
+        Evaluates the committed components and the active one directly at the given instants.
+
+        :param running_sum: reuse the running sum of the committed components over linspace, for linspaces that
+                            are evaluated repeatedly (such as the displayed one).
+        """
+        if running_sum:
+            data_points = self.committed_components_sum(linspace).copy()
         else:
-            data_points = np.sum([component.get_data_points(self.sampling_origin_linspace) for component in self.frequency_components],
-                                 axis=0)
-            if self.active_component.amplitude != 0:
-                data_points += self.active_component.get_data_points(self.sampling_origin_linspace)
-            return_object.plot_points = np.interp(linspace, self.sampling_origin_linspace, data_points)
-            # return_object.plot_points = data_points
-
-        noise = np.zeros_like(data_points)
-
-        if with_noise:
-            # SNR = 10 * log10(P_signal / P_noise)
-            print("required SNR: ", self.SNR)
-            signal_power = np.sum(data_points ** 2) / len(data_points)
-            noise_power = signal_power / (10 ** (self.SNR / 10))
-            scaling_factor = np.sqrt(noise_power)
-            noise = self.base_noise * scaling_factor
-            noise_power = np.sum(noise ** 2) / len(noise)
-            print("achieved SNR:", 10 * np.log10(signal_power / noise_power))
-            # data_points += noise
-        return_object.noise = np.interp(linspace, self.sampling_origin_linspace, noise)
-        # return_object.noise = noise
+            data_points = self.frequency_components.get_data_points(linspace)
+        if self.active_component.amplitude != 0:
+            data_points += self.active_component.get_data_points(linspace)
+        return data_points
 
-        sampling_period = 1 / sampling_frequency
+    def composed_signal_power(self):
+        """
+        Mean power of the composed signal, computed from its components rather than from data points.
+
+        Components sharing a frequency are added as phasors first, after which distinct frequencies contribute
+        amplitude^2 / 2 each (a DC term contributes its squared value).
+        """
+        frequencies = self.frequency_components.frequencies
+        phasors = self.frequency_components.amplitudes * np.exp(1j * np.pi * self.frequency_components.phases)
+        if self.active_component.amplitude != 0:
+            frequencies = np.append(frequencies, self.active_component.frequency)
+            phasors = np.append(phasors,
+                                self.active_component.amplitude * np.exp(1j * np.pi * self.active_component.phase))
+        if len(frequencies) == 0:
+            return 0.0
+
+        unique_frequencies, groups = np.unique(np.abs(frequencies), return_inverse=True)
+        # cos is even, so a negative frequency is the conjugate phasor at the positive one
+        phasors = np.where(frequencies < 0, np.conj(phasors), phasors)
+        frequency_phasors = np.bincount(groups, weights=phasors.real) + 1j * np.bincount(groups, weights=phasors.imag)
+        powers = np.where(unique_frequencies == 0, frequency_phasors.real ** 2, np.abs(frequency_phasors) ** 2 / 2)
+        return float(np.sum(powers))
+
+    def signal_points(self, linspace, running_sum=False):
+        """Evaluates the noiseless signal (file data, committed and active components) at the given instants."""
+        if self.signal_type != Signal.FROM_FILE:
+            return self.composed_data_points(linspace, running_sum)
+        data_points = Precision.values(self.pyramid.sample(linspace))
+        data_points += self.committed_components_sum(linspace) if running_sum \
+            else self.frequency_components.get_data_points(linspace)
+        if self.active_component.amplitude != 0:
+            data_points += self.active_component.get_data_points(linspace)
+        return data_points
+
+    def signal_power(self):
+        """Mean power of the noiseless signal, over the file's own time column for file signals."""
+        if self.signal_type != Signal.FROM_FILE:
+            return self.composed_signal_power()
+        if len(self.frequency_components) == 0 and self.active_component.amplitude == 0:
+            return self.pyramid.power
+        data_points = self.signal_points(self.plotting_linspace, running_sum=True)
+        return np.sum(data_points ** 2) / len(data_points)
+
+    def envelope_points(self, x_min, x_max, pixels, with_noise=True, signal_power=None):
+        """
+        Points to draw the noisy signal over [x_min, x_max] with, at about `pixels` points, keeping the peaks of
+        the file's data (see SignalPyramid.envelope).
+
+        :param signal_power: signal_power() when already known, see noise_points.
+
+        :return: tuple (time points, signal), or None for composed signals, which are drawn from signal_points.
+        """
+        if self.pyramid is None:
+            return None
+        linspace, data_points = self.pyramid.envelope(x_min, x_max, pixels)
+        data_points += self.frequency_components.get_data_points(linspace)
+        if self.active_component.amplitude != 0:
+            data_points += self.active_component.get_data_points(linspace)
+        return linspace, data_points + self.noise_points(linspace, with_noise, signal_power)
+
+    def time_bounds(self):
+        """Start and stop of the span the signal is sampled over."""
         if self.signal_type == Signal.FROM_FILE:
-            all_samples_linspace = np.arange(self.linspace_start, self.linspace_stop, sampling_period)
-            points_linspace = linspace
+            return self.linspace_start, self.linspace_stop
+        return self.complete_linspace_start, self.complete_linspace_stop
+
+    def set_noise_seed(self, seed):
+        """Redraws the unit power noise realization from the given seed, so it can be reproduced."""
+        self.noise_seed = seed
+        self.noise_draw = next(Signal.noise_draws)
+        if seed is None:
+            self.base_noise = Precision.values(np.random.normal(0, 1, len(self.noise_linspace)))
         else:
-            all_samples_linspace = np.arange(self.complete_linspace_start, self.complete_linspace_stop, sampling_period)
-            points_linspace = self.sampling_origin_linspace
-        all_samples = np.interp(all_samples_linspace, points_linspace, data_points + noise)
-        return_object.all_samples = all_samples
+            self.base_noise = Precision.values(np.random.default_rng(seed).standard_normal(len(self.noise_linspace)))
 
-        sampling_linspace = np.arange(self.linspace_start, self.linspace_stop, sampling_period)
-        samples_to_plot = np.interp(sampling_linspace, linspace, return_object.plot_points + return_object.noise)
-        return_object.plot_samples = samples_to_plot
-        return_object.plot_samples_linspace = sampling_linspace
-        # return_object.plot_samples = all_samples
-        # return_object.plot_samples_linspace = all_samples_linspace
+    def cover_noise_span(self, start, stop):
+        """
+        Extends the noise grid over [start, stop] at the same density and redraws the realization on it, when the
+        span reaches past the grid. Instants past the grid would otherwise all get its last value as noise.
+        """
+        if start >= self.noise_linspace[0] and stop <= self.noise_linspace[-1]:
+            return
+        start = min(float(start), self.noise_linspace[0])
+        stop = max(float(stop), self.noise_linspace[-1])
+        self.noise_linspace = np.linspace(start, stop, int(np.ceil((stop - start) * Signal.NOISE_RATE)))
+        self.set_noise_seed(self.noise_seed)
 
+    def unit_noise_points(self, linspace):
+        """The unit power noise realization at the given instants, linearly interpolated from its grid."""
+        return Precision.interp(linspace, self.noise_linspace, self.base_noise)
+
+    def noise_points(self, linspace, with_noise=True, signal_power=None):
+        """
+        Evaluates the noise realization at the given instants, scaled to the current SNR.
+
+        :param signal_power: signal_power() when already known. It takes a pass over the data of file signals with
+                             components, so callers evaluating the noise several times per update compute it once.
+        """
+        if not with_noise:
+            return Precision.zeros(len(linspace))
+        if signal_power is None:
+            signal_power = self.signal_power()
+        # SNR = 10 * log10(P_signal / P_noise)
+        noise_power = signal_power / (10 ** (self.SNR / 10))
+        scaling_factor = np.sqrt(noise_power)
+        noise = self.unit_noise_points(linspace)
+        noise *= scaling_factor
+        return Precision.values(noise)
+
+    # --------------------------------------------------------
+    def get_data_points(self, linspace, with_noise=True, sampling_frequency=1):
+        # Can change this to return the needed data points type
+        return_object = DataPointsObject()
+        signal_power = self.signal_power() if with_noise else None
+        # Composed signals are evaluated in closed form at the displayed points and at the sample instants,
+        # so no dense grid has to be synthesized
+        with Profiler.span("synthesis"):
+            return_object.plot_points = self.signal_points(linspace, running_sum=True)
+        with Profiler.span("noise"):
+            return_object.noise = self.noise_points(linspace, with_noise, signal_power)
+        if with_noise and Profiler.tracing:
+            noise_power = np.sum(return_object.noise ** 2) / len(return_object.noise)
+            Profiler.counter("achieved SNR", 10 * np.log10(signal_power / noise_power))
+
+        with Profiler.span("sampling"):
+            (return_object.all_samples_linspace, return_object.all_samples,
+             return_object.plot_samples_linspace, return_object.plot_samples) = self.sample_points(sampling_frequency,
+                                                                                                   with_noise,
+                                                                                                   signal_power)
         return_object.complete_linspace = self.sampling_origin_linspace
 
         return return_object
+
+    def sample_points(self, sampling_frequency, with_noise=True, signal_power=None):
+        """
+        Samples the (noisy) signal at the given frequency.
+
+        :param signal_power: signal_power() when already known, see noise_points.
+
+        :return: tuple (instants and values of all the samples reconstructed from, instants and values of the
+                 samples within the signal's own span).
+        """
+        sampling_period = 1 / sampling_frequency
+        sampling_linspace = np.arange(self.linspace_start, self.linspace_stop, sampling_period)
+        if self.signal_type == Signal.FROM_FILE:
+            all_samples_linspace = sampling_linspace
+        else:
+            all_samples_linspace = np.arange(self.complete_linspace_start, self.complete_linspace_stop,
+                                             sampling_period)
+
+        if with_noise and signal_power is None:
+            signal_power = self.signal_power()
+        all_samples = (self.signal_points(all_samples_linspace) +
+                       self.noise_points(all_samples_linspace, with_noise, signal_power))
+        plot_samples = self.signal_points(sampling_linspace) + self.noise_points(sampling_linspace, with_noise,
+                                                                                 signal_power)
+        return all_samples_linspace, all_samples, sampling_linspace, plot_samples
@@ -0,0 +1,174 @@
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+
+class SignalLoader:
+    """
+    Loads (time, value) signals from CSV files through a binary sidecar.
+
+    The first load parses the CSV in chunks into a `<file>.sidecar` directory next to it, holding the time and
+    value columns as float64 .npy files, plus the values in any other dtype requested since. Later loads
+    memory-map the .npy files, so opening a recording costs no parsing and its pages are only read when used.
+    The sidecar records the size and modification time of the CSV it was built from and is rebuilt once they
+    change. Every file is written under a unique temporary name and renamed into place, so processes loading the
+    same CSV at once never read a partial sidecar nor remove each other's files.
+    """
+    SIDECAR_SUFFIX = ".sidecar"
+    SOURCE_FILE = "source.json"
+    TIME_FILE = "time.npy"
+
+    # Rows parsed at once while building a sidecar
+    CHUNK_ROWS = 1_000_000
+
+    @staticmethod
+    def sidecar_path(file_path):
+        return file_path + SignalLoader.SIDECAR_SUFFIX
+
+    @staticmethod
+    def values_file(dtype):
+        return f"values.{np.dtype(dtype).name}.npy"
+
+    @staticmethod
+    def source_stamp(file_path):
+        status = os.stat(file_path)
+        return {"size": status.st_size, "mtime_ns": status.st_mtime_ns}
+
+    @staticmethod
+    def is_fresh(file_path):
+        """Whether the sidecar of file_path exists and matches the CSV on disk."""
+        sidecar_path = SignalLoader.sidecar_path(file_path)
+        try:
+            with open(os.path.join(sidecar_path, SignalLoader.SOURCE_FILE), 'r') as file:
+                source = json.load(file)
+        except (OSError, ValueError):
+            return False
+        return (source.get("stamp") == SignalLoader.source_stamp(file_path) and
+                os.path.exists(os.path.join(sidecar_path, SignalLoader.TIME_FILE)) and
+                os.path.exists(os.path.join(sidecar_path, SignalLoader.values_file(np.float64))))
+
+    @staticmethod
+    def read_csv_columns(file_path, dtype=np.float64):
+        """
+        Parses the time and value columns of the CSV a chunk at a time.
+
+        :return: tuple (time chunks, value chunks, column names).
+        """
+        # Only needed to build a sidecar, loads from one never import pandas
+        import pandas as pd
+
+        time_chunks, value_chunks = [], []
+        columns = None
+        for chunk in pd.read_csv(file_path, chunksize=SignalLoader.CHUNK_ROWS):
+            if columns is None:
+                columns = list(chunk.columns)
+                if 'Time' not in columns or len(columns) < 2:
+                    raise ValueError("CSV file must contain 'Time' and a second column for signal data.")
+            time_chunks.append(chunk['Time'].to_numpy(dtype=np.float64))
+            value_chunks.append(chunk.iloc[:, 1].to_numpy(dtype=dtype))  # Use second column as data points
+        if columns is None:
+            raise ValueError("CSV file is empty.")
+        return time_chunks, value_chunks, columns[:2]
+
+    @staticmethod
+    def write_column(file_path, chunks, dtype):
+        """Writes the chunks one after the other into a single .npy file, through a temporary file of its own."""
+        descriptor, temporary_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(file_path))
+        os.close(descriptor)
+        try:
+            column = np.lib.format.open_memmap(temporary_path, mode='w+', dtype=dtype,
+                                               shape=(sum(len(chunk) for chunk in chunks),))
+            start = 0
+            for chunk in chunks:
+                column[start:start + len(chunk)] = chunk
+                start += len(chunk)
+            column.flush()
+            del column
+            os.replace(temporary_path, file_path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    @staticmethod
+    def build_sidecar(file_path):
+        """
+        Parses the CSV and writes its sidecar, with float64 values.
+
+        The sidecar is built in a temporary directory next to it, which then replaces the previous sidecar.
+        """
+        stamp = SignalLoader.source_stamp(file_path)
+        time_chunks, value_chunks, columns = SignalLoader.read_csv_columns(file_path)
+
+        sidecar_path = SignalLoader.sidecar_path(file_path)
+        build_path = tempfile.mkdtemp(prefix=os.path.basename(sidecar_path) + ".", suffix=".tmp",
+                                      dir=os.path.dirname(os.path.abspath(sidecar_path)))
+        try:
+            SignalLoader.write_column(os.path.join(build_path, SignalLoader.TIME_FILE), time_chunks, np.float64)
+            SignalLoader.write_column(os.path.join(build_path, SignalLoader.values_file(np.float64)), value_chunks,
+                                      np.float64)
+            with open(os.path.join(build_path, SignalLoader.SOURCE_FILE), 'w') as file:
+                json.dump({"file": os.path.basename(file_path), "columns": columns, "stamp": stamp}, file)
+            SignalLoader.replace_directory(build_path, sidecar_path)
+        finally:
+            shutil.rmtree(build_path, ignore_errors=True)
+
+    @staticmethod
+    def replace_directory(source_path, destination_path):
+        """
+        Renames the directory source_path to destination_path, moving the directory it replaces aside first.
+
+        If another process renames its own directory in between, that one is kept. Files of the replaced
+        directory stay readable through the memory maps already open on them.
+        """
+        discarded_path = tempfile.mkdtemp(prefix=os.path.basename(destination_path) + ".", suffix=".old",
+                                          dir=os.path.dirname(os.path.abspath(destination_path)))
+        try:
+            try:
+                os.rename(destination_path, os.path.join(discarded_path, os.path.basename(destination_path)))
+            except FileNotFoundError:
+                pass
+            try:
+                os.rename(source_path, destination_path)
+            except OSError:
+                if not os.path.isdir(destination_path):
+                    raise
+        finally:
+            shutil.rmtree(discarded_path, ignore_errors=True)
+
+    @staticmethod
+    def add_values_dtype(file_path, dtype):
+        """Derives the values in another dtype from the float64 values of a fresh sidecar."""
+        sidecar_path = SignalLoader.sidecar_path(file_path)
+        values = np.load(os.path.join(sidecar_path, SignalLoader.values_file(np.float64)), mmap_mode='r')
+        chunks = (values[start:start + SignalLoader.CHUNK_ROWS].astype(dtype)
+                  for start in range(0, len(values), SignalLoader.CHUNK_ROWS))
+        SignalLoader.write_column(os.path.join(sidecar_path, SignalLoader.values_file(dtype)), list(chunks), dtype)
+
+    @staticmethod
+    def load(file_path, dtype=np.float64, use_sidecar=True):
+        """
+        Loads the time and value columns of a CSV signal.
+
+        :param dtype: dtype of the values, e.g. np.float32 to halve their footprint. Time is always float64.
+        :param use_sidecar: whether to read and write the binary sidecar, the CSV is parsed directly otherwise.
+        :return: tuple (time, values), memory-mapped read-only arrays when loaded from the sidecar.
+        """
+        if use_sidecar:
+            sidecar_path = SignalLoader.sidecar_path(file_path)
+            try:
+                if not SignalLoader.is_fresh(file_path):
+                    SignalLoader.build_sidecar(file_path)
+                if not os.path.exists(os.path.join(sidecar_path, SignalLoader.values_file(dtype))):
+                    SignalLoader.add_values_dtype(file_path, dtype)
+                return (np.load(os.path.join(sidecar_path, SignalLoader.TIME_FILE), mmap_mode='r'),
+                        np.load(os.path.join(sidecar_path, SignalLoader.values_file(dtype)), mmap_mode='r'))
+            except OSError:
+                # Read-only location, or a sidecar replaced by another process while it was being read (on
+                # Windows, one still mapped cannot be replaced): parse the CSV without a sidecar
+                pass
+
+        time_chunks, value_chunks, _ = SignalLoader.read_csv_columns(file_path, dtype)
+        return np.concatenate(time_chunks), np.concatenate(value_chunks)
@@ -0,0 +1,115 @@
+import numpy as np
+
+from Precision import Precision
+
+
+class SignalPyramid:
+    """
+    Multi-resolution min/max pyramid over a sampled (time, value) recording.
+
+    Level k summarizes blocks of LEVEL_FACTOR ** k consecutive points by their minimum and maximum, each with the
+    time it occurs at. Drawing a window over a given number of pixels reads the coarsest level that still has a
+    block per pixel, so an overview costs O(pixels) whatever the recording length, and every peak is kept.
+    """
+    LEVEL_FACTOR = 4
+
+    # Levels stop once they have fewer blocks than this
+    MIN_BLOCKS = 64
+
+    # Sampling interpolates over the whole recording when it has fewer points than this many per instant, gathering
+    # the bracketing points first costs more than np.interp's own pass over the columns
+    DIRECT_SAMPLING_RATIO = 32
+
+    def __init__(self, time, values, levels=None, power=None):
+        """:param levels, power: previously built levels and power of the same recording, e.g. memory-mapped."""
+        self.time = time
+        self.values = values
+        # Mean power of the recording, so the SNR of file signals needs no pass over it
+        if power is None:
+            power = float(np.mean(np.square(values, dtype=np.float64))) if len(values) else 0.0
+        self.power = power
+        # Per level (min times, min values, max times, max values), levels[0] being the first reduced one
+        self.levels = []
+        if levels is None:
+            self.build()
+        else:
+            self.levels = list(levels)
+
+    def build(self):
+        min_times, min_values = self.time, self.values
+        max_times, max_values = self.time, self.values
+        while len(min_values) >= SignalPyramid.LEVEL_FACTOR * SignalPyramid.MIN_BLOCKS:
+            min_times, min_values = SignalPyramid.reduce(min_times, min_values, np.argmin, np.inf)
+            max_times, max_values = SignalPyramid.reduce(max_times, max_values, np.argmax, -np.inf)
+            self.levels.append((min_times, min_values, max_times, max_values))
+
+    @staticmethod
+    def reduce(times, values, arg_function, padding):
+        """Picks the extreme of every block of LEVEL_FACTOR points, along with its time."""
+        factor = SignalPyramid.LEVEL_FACTOR
+        blocks = -(-len(values) // factor)
+        padded = np.full(blocks * factor, padding)
+        padded[:len(values)] = values
+        extremes = arg_function(padded.reshape(blocks, factor), axis=1) + np.arange(blocks) * factor
+        return np.asarray(times[extremes], dtype=np.float64), np.asarray(values[extremes], dtype=np.float64)
+
+    def sample(self, linspace):
+        """
+        Linearly interpolates the recording at the given instants, as np.interp would.
+
+        For a few instants over a long recording only the points bracketing each instant are read, so sampling
+        does not depend on the recording length. In float32, Precision.interp reads only those points anyway.
+
+        :return: values in the compute dtype.
+        """
+        linspace = np.asarray(linspace, dtype=np.float64)
+        if (Precision.dtype != Precision.FLOAT64 or len(self.time) < 2
+                or not 0 < len(linspace) * SignalPyramid.DIRECT_SAMPLING_RATIO < len(self.time)):
+            return Precision.interp(linspace, self.time, self.values)
+        right = np.clip(np.searchsorted(self.time, linspace, side='right'), 1, len(self.time) - 1)
+        if np.any(right[1:] < right[:-1]):
+            right = np.sort(right)
+        # Once the repeated brackets are dropped, interleaving (right - 1, right) is non-decreasing, so the points
+        # shared by neighbouring brackets are adjacent duplicates
+        right = right[SignalPyramid.first_of_runs(right)]
+        indices = np.empty(2 * len(right), dtype=right.dtype)
+        indices[0::2] = right - 1
+        indices[1::2] = right
+        indices = indices[SignalPyramid.first_of_runs(indices)]
+        return np.interp(linspace, self.time[indices], np.asarray(self.values[indices], dtype=np.float64))
+
+    @staticmethod
+    def first_of_runs(sorted_array):
+        """:return: mask of the elements differing from their predecessor, np.unique's without sorting again."""
+        mask = np.empty(len(sorted_array), dtype=bool)
+        mask[:1] = True
+        np.not_equal(sorted_array[1:], sorted_array[:-1], out=mask[1:])
+        return mask
+
+    def envelope(self, x_min, x_max, pixels):
+        """
+        Points to draw the window [x_min, x_max] over `pixels` pixels with.
+
+        :return: tuple (time points, values), the raw points if there are few enough, otherwise the minimum and
+                 maximum of every block of the level with at least one block per pixel, in time order.
+        """
+        start = max(int(np.searchsorted(self.time, x_min, side='right')) - 1, 0)
+        stop = min(int(np.searchsorted(self.time, x_max, side='left')) + 1, len(self.time))
+        level = 0
+        while level < len(self.levels) and (stop - start) / SignalPyramid.LEVEL_FACTOR ** (level + 1) >= pixels:
+            level += 1
+        if level == 0:
+            return (np.array(self.time[start:stop], dtype=np.float64),
+                    np.array(self.values[start:stop], dtype=np.float64))
+
+        block_size = SignalPyramid.LEVEL_FACTOR ** level
+        min_times, min_values, max_times, max_values = (array[start // block_size:-(-stop // block_size)]
+                                                        for array in self.levels[level - 1])
+        min_first = min_times <= max_times
+        linspace = np.empty(2 * len(min_times))
+        data_points = np.empty(2 * len(min_times))
+        linspace[0::2] = np.where(min_first, min_times, max_times)
+        linspace[1::2] = np.where(min_first, max_times, min_times)
+        data_points[0::2] = np.where(min_first, min_values, max_values)
+        data_points[1::2] = np.where(min_first, max_values, min_values)
+        return linspace, data_points
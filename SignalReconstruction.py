@@ -1,5 +1,79 @@
+import copy
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from scipy.interpolate import interp1d, lagrange, CubicSpline
+
+from Precision import Precision
+from Profiler import Profiler
+
+
+class ReconstructionCache:
+    """
+    LRU store for the sample-independent artifacts of a reconstruction (index maps, kernel weights).
+
+    Artifacts only depend on the sampling grid and the timespace, so repeated reconstructions on the same
+    grid reduce to a gather or a matrix-vector product. Entries are evicted least recently used first once
+    their total size exceeds max_bytes.
+    """
+    DEFAULT_MAX_BYTES = 256 * 1024 ** 2
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes or ReconstructionCache.DEFAULT_MAX_BYTES
+        self.entries = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # Chunks of a reconstruction read and fill the cache from several threads
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def size_of(value):
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, (tuple, list)):
+            return sum(ReconstructionCache.size_of(item) for item in value)
+        return 0
+
+    def get(self, key, build):
+        """Returns the artifact stored under key, building (and storing) it on a miss."""
+        with self.lock:
+            if key in self.entries:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return self.entries[key][0]
+            self.misses += 1
+
+        # Built outside the lock, so that the chunks of a reconstruction build their artifacts concurrently
+        value = build()
+        size = ReconstructionCache.size_of(value)
+        if size <= self.max_bytes:
+            with self.lock:
+                if key not in self.entries:
+                    self.entries[key] = (value, size)
+                    self.current_bytes += size
+                while self.current_bytes > self.max_bytes:
+                    _, (_, evicted_size) = self.entries.popitem(last=False)
+                    self.current_bytes -= evicted_size
+        return value
+
+    def clear(self):
+        self.entries.clear()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes
+        }
 
 
 class SignalReconstruction:
@@ -9,16 +83,50 @@ class SignalReconstruction:
     CUBIC_SPLINE = 1003
     FOURIER = 1004
     NEAREST_NEIGHBOR = 1005
+    WINDOWED_SINC = 1006
+
+    # Upper bound on the size of one (samples x time points) sinc tile
+    MAX_BLOCK_BYTES = 16 * 1024 ** 2
+
+    # Number of samples each output point of the windowed sinc depends on
+    DEFAULT_TAPS = 16
 
-    def __init__(self, samples, sampling_frequency, timespace):
+    # Largest upsampling of the Fourier reconstruction's inverse FFT grid. At 1024 points per sample period, linearly
+    # interpolating the grid is off by at most ~1e-6 of the amplitude at the band edge
+    MAX_FOURIER_UPSAMPLING = 1024
+
+    # Shared by every reconstruction unless one is given to the constructor
+    cache = ReconstructionCache()
+
+    # Threads the timespace is split over, see set_workers
+    workers = os.cpu_count() or 1
+    # Smallest chunk of the timespace given to a thread, shorter timespaces are reconstructed on the calling one
+    MIN_POINTS_PER_CHUNK = 16_384
+    # Methods whose cost is proportional to the points reconstructed. The Fourier reconstruction computes the whole
+    # upsampled span whatever the points, so it is not split
+    CHUNKED_METHODS = (ZERO_ORDER_HOLD, LINEAR, NYQUIST, CUBIC_SPLINE, NEAREST_NEIGHBOR, WINDOWED_SINC)
+    executor = None
+    executor_lock = threading.Lock()
+
+    def __init__(self, samples, sampling_frequency, timespace, max_block_bytes=None, taps=None, cache=None,
+                 sample_times=None):
         self.samples = samples
         self.sampling_frequency = sampling_frequency
         self.timespace = timespace
+        self.max_block_bytes = max_block_bytes or SignalReconstruction.MAX_BLOCK_BYTES
+        self.taps = taps or SignalReconstruction.DEFAULT_TAPS
+        if cache is not None:
+            self.cache = cache
 
         self.sampling_period = 1 / self.sampling_frequency
-        self.sample_times = np.arange(self.timespace[0], self.timespace[-1], self.sampling_period)
+        # The sample instants default to a grid starting at the timespace; they are given explicitly when only a
+        # window of the samples' span is reconstructed
+        if sample_times is None:
+            sample_times = np.arange(self.timespace[0], self.timespace[-1], self.sampling_period)
+        self.sample_times = np.asarray(sample_times, dtype=np.float64)
 
         self.interpolation_function = None
+        self.timespace_fingerprints = {}
 
     @staticmethod
     def sinc(x):
@@ -28,11 +136,41 @@ class SignalReconstruction:
         return np.sin(np.pi * x) / (np.pi * x)
 
 
+    @staticmethod
+    def set_workers(workers):
+        """Sets the number of threads reconstructions are split over, 1 reconstructing on the calling thread."""
+        with SignalReconstruction.executor_lock:
+            if SignalReconstruction.executor is not None:
+                SignalReconstruction.executor.shutdown(wait=True)
+                SignalReconstruction.executor = None
+            SignalReconstruction.workers = max(int(workers), 1)
+
+    @staticmethod
+    def import_scipy():
+        """
+        Imports scipy.interpolate ahead of the first cubic spline reconstruction.
+
+        scipy is imported on first use, which takes over a second: processes timing their reconstructions, or
+        drawing them frame by frame, call this first so the import is not counted in the first one.
+        """
+        import scipy.interpolate
+
+    @staticmethod
+    def thread_pool():
+        with SignalReconstruction.executor_lock:
+            if SignalReconstruction.executor is None:
+                SignalReconstruction.executor = ThreadPoolExecutor(SignalReconstruction.workers,
+                                                                   thread_name_prefix="reconstruction")
+            return SignalReconstruction.executor
+
     def reconstruct_signal(self, method=NYQUIST):
         """
         Reconstructs the signal using the selected technique.
 
-        :return: np.array containing the reconstructed signal.
+        The samples can also be a (realizations x samples) block, every row being reconstructed in the same pass.
+        Long timespaces are split into chunks reconstructed in parallel, see reconstruct_in_chunks.
+
+        :return: np.array containing the reconstructed signal, one row per realization for a block of samples.
         """
         if method == SignalReconstruction.ZERO_ORDER_HOLD:
             self.interpolation_function = self.zero_order_hold
@@ -46,57 +184,387 @@ class SignalReconstruction:
             self.interpolation_function = self.fourier_series_interpolation
         elif method == SignalReconstruction.NEAREST_NEIGHBOR:
             self.interpolation_function = self.nearest_neighbor_interpolation
-        return self.interpolation_function()
+        elif method == SignalReconstruction.WINDOWED_SINC:
+            self.interpolation_function = self.windowed_sinc_interpolation
+        with Profiler.span("reconstruction/" + self.interpolation_function.__name__):
+            chunks = min(SignalReconstruction.workers, len(self.timespace) // SignalReconstruction.MIN_POINTS_PER_CHUNK)
+            if chunks > 1 and method in SignalReconstruction.CHUNKED_METHODS:
+                return self.reconstruct_in_chunks(chunks)
+            return Precision.values(self.interpolation_function())
+
+    def reconstruct_in_chunks(self, chunks):
+        """
+        Splits the timespace into contiguous chunks reconstructed on the thread pool.
+
+        Output points are independent of each other, and NumPy and SciPy release the GIL in most of the kernels,
+        so the chunks can run concurrently. Each one writes its slice of a preallocated output.
+        """
+        method_name = self.interpolation_function.__name__
+        bounds = np.linspace(0, len(self.timespace), chunks + 1).astype(int)
+        reconstructed = np.empty(np.shape(self.samples)[:-1] + (len(self.timespace),), dtype=Precision.dtype)
+        timespace_fingerprint = self.fingerprint(self.timespace)
+
+        def reconstruct_chunk(start, stop):
+            chunk = copy.copy(self)
+            chunk.timespace = self.timespace[start:stop]
+            # The chunks' cached artifacts are keyed by their range of the timespace, which needs no hashing
+            chunk.timespace_fingerprints = {id(chunk.timespace): (chunk.timespace,
+                                                                  timespace_fingerprint + repr((start, stop)).encode())}
+            reconstructed[..., start:stop] = getattr(chunk, method_name)()
+
+        futures = [SignalReconstruction.thread_pool().submit(reconstruct_chunk, start, stop)
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        for future in futures:
+            future.result()
+        return reconstructed
+
+    def fingerprint(self, timespace):
+        """Digest of the timespace contents, computed once per array for this reconstruction."""
+        if id(timespace) not in self.timespace_fingerprints:
+            contents = np.ascontiguousarray(timespace, dtype=np.float64)
+            self.timespace_fingerprints[id(timespace)] = (timespace, hashlib.blake2b(contents, digest_size=16).digest())
+        return self.timespace_fingerprints[id(timespace)][1]
+
+    def cached(self, method, timespace, build, *parameters):
+        """Fetches an artifact of `method` for this sampling grid and timespace from the cache."""
+        first_sample_time = float(self.sample_times[0]) if len(self.sample_times) else 0.0
+        key = (method, self.sampling_frequency, first_sample_time, len(self.sample_times),
+               np.shape(self.samples)[-1], self.fingerprint(timespace), Precision.dtype.str) + parameters
+        return self.cache.get(key, build)
+
+    def truncated_samples(self):
+        """Samples in the compute precision, limited to the ones that have a sample instant on this grid."""
+        samples = Precision.values(self.samples)
+        return samples[..., :len(self.sample_times)]
 
-    def nyquist_interpolation(self):
+    def block_sizes(self, rows, columns):
+        """
+        Splits a (rows x columns) matrix of the compute precision into tiles that fit in max_block_bytes.
+
+        :return: tuple (rows per tile, columns per tile).
+        """
+        max_elements = max(self.max_block_bytes // Precision.dtype.itemsize, 1)
+        rows_per_block = max(min(rows, max_elements), 1)
+        columns_per_block = max(min(columns, max_elements // rows_per_block), 1)
+        return rows_per_block, columns_per_block
+
+    def sinc_terms(self, timespace, samples_count):
+        """
+        Splits u = (t - t_0) / T into its nearest sample k = round(u) and remainder r = u - k.
+
+        :return: tuple (u, sin(pi * u) / pi, mask of points falling on a sample instant, that sample's index).
+        """
+        normalized_timespace = (np.asarray(timespace, dtype=np.float64) - self.sample_times[0]) / self.sampling_period
+        nearest_sample = np.rint(normalized_timespace)
+        remainder = normalized_timespace - nearest_sample
+        sign = np.where(nearest_sample % 2 == 0, 1.0, -1.0)
+        sine_term = sign * np.sin(np.pi * remainder) / np.pi
+
+        small_value_threshold = 1e-10
+        on_sample = ((np.abs(remainder) < small_value_threshold) & (nearest_sample >= 0) &
+                     (nearest_sample < samples_count))
+        return normalized_timespace, sine_term, on_sample, nearest_sample[on_sample].astype(int)
+
+    def nyquist_kernel(self, timespace, samples_count):
+        """Builds the full (samples x time points) sinc matrix, used when it fits in the cache budget."""
+        normalized_timespace, sine_term, on_sample, on_sample_indices = self.sinc_terms(timespace, samples_count)
+        sample_indices = np.arange(samples_count, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # u - i is computed in float64, then rounded once to the compute precision
+            kernel = np.subtract(normalized_timespace[np.newaxis, :], sample_indices[:, np.newaxis],
+                                 out=np.empty((samples_count, len(normalized_timespace)), dtype=Precision.dtype))
+            np.reciprocal(kernel, out=kernel)
+            kernel *= sine_term
+        kernel[1::2] *= -1
+        kernel[:, on_sample] = 0
+        kernel[on_sample_indices, np.flatnonzero(on_sample)] = 1
+        return kernel
+
+    def nyquist_interpolation(self, timespace=None):
         """
         Reconstruct the signal using Nyquist interpolation (sinc function).
 
-        :param samples: np.array containing the sampled data points.
-        :param sampling_frequency: int representing the sampling frequency.
+        Uses sinc((t - t_i) / T) = (-1)^(k - i) * sin(pi * r) / (pi * (u - i)), with u = (t - t_0) / T, k = round(u)
+        and r = u - k, so the (samples x time points) kernel only needs a reciprocal per element. The kernel is
+        evaluated in tiles bounded by max_block_bytes, each tile being reduced with a matrix-vector product.
+        When the whole kernel fits in the cache budget it is built once per sampling grid and reused.
+
+        :param timespace: optional time points to evaluate at, defaults to self.timespace.
         :return: np.array containing the reconstructed signal.
         """
-        reconstructed = np.zeros_like(self.timespace)
-        for i in range(len(self.samples)):
-            reconstructed += self.samples[i] * SignalReconstruction.sinc((self.timespace - self.sample_times[i]) / self.sampling_period)
+        timespace = self.timespace if timespace is None else timespace
+        samples = self.truncated_samples()
+        samples_count = samples.shape[-1]
+        reconstructed = Precision.zeros(samples.shape[:-1] + (len(timespace),))
+        if samples_count == 0:
+            return reconstructed
+
+        kernel_bytes = samples_count * len(timespace) * Precision.dtype.itemsize
+        if kernel_bytes <= self.cache.max_bytes // 4:
+            kernel = self.cached(SignalReconstruction.NYQUIST, timespace,
+                                 lambda: self.nyquist_kernel(timespace, samples_count))
+            return samples @ kernel
+
+        normalized_timespace, sine_term, on_sample, on_sample_indices = self.sinc_terms(timespace, samples_count)
+        sample_indices = np.arange(samples_count, dtype=np.float64)
+        alternating_samples = np.where(sample_indices % 2 == 0, samples, -samples)
+        samples_per_block, points_per_block = self.block_sizes(samples_count, len(normalized_timespace))
+        tile = np.empty((samples_per_block, points_per_block), dtype=Precision.dtype)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for start in range(0, len(normalized_timespace), points_per_block):
+                stop = min(start + points_per_block, len(normalized_timespace))
+                points = normalized_timespace[start:stop]
+                for sample_start in range(0, samples_count, samples_per_block):
+                    sample_stop = min(sample_start + samples_per_block, samples_count)
+                    kernel = tile[:sample_stop - sample_start, :stop - start]
+                    np.subtract(points[np.newaxis, :], sample_indices[sample_start:sample_stop, np.newaxis], out=kernel)
+                    np.reciprocal(kernel, out=kernel)
+                    reconstructed[..., start:stop] += alternating_samples[..., sample_start:sample_stop] @ kernel
+            reconstructed *= sine_term
+
+        # Points that fall on a sample instant take that sample's value (sinc(0) = 1, sinc(n) = 0)
+        reconstructed[..., on_sample] = samples[..., on_sample_indices]
         return reconstructed
 
-    def fourier_series_interpolation(self):
+    @staticmethod
+    def lanczos_kernel(x, lobes):
+        """Compute the Lanczos window, sinc(x) * sinc(x / lobes) inside |x| < lobes and 0 outside."""
+        return np.where(np.abs(x) < lobes, np.sinc(x) * np.sinc(x / lobes), 0.0)
+
+    def windowed_sinc_weights(self, timespace, samples_count):
         """
-        Computes the Fourier coefficients and reconstructs the signal using the inverse Fourier transform.
+        Builds the truncated sinc weights of every time point.
 
-        :param samples: np.array containing the sampled data points.
-        :param sampling_frequency: int representing the sampling frequency.
-        :return: np.array containing the reconstructed signal.
+        :return: tuple of (taps x time points) sample indices and Lanczos weights, zero outside the samples.
+        """
+        lobes = max(self.taps // 2, 1)
+        normalized_timespace = (np.asarray(timespace, dtype=np.float64) - self.sample_times[0]) / self.sampling_period
+        base_indices = np.floor(normalized_timespace).astype(np.int64)
+        indices = base_indices[np.newaxis, :] + np.arange(1 - lobes, lobes + 1)[:, np.newaxis]
+        weights = SignalReconstruction.lanczos_kernel(normalized_timespace - indices, lobes)
+        weights[(indices < 0) | (indices >= samples_count)] = 0
+        return np.clip(indices, 0, samples_count - 1).astype(np.int32), Precision.values(weights)
+
+    def windowed_sinc_interpolation(self, timespace=None):
         """
-        # Get the first few Fourier coefficients
-        fft_coeffs = np.fft.fft(self.samples)
+        Reconstruct the signal with a Lanczos-windowed sinc kernel of finite support.
 
-        # Reconstruct the signal using the inverse Fourier transform
-        reconstructed = np.fft.ifft(fft_coeffs)
+        Every output point only depends on the `taps` nearest samples, so the cost is O(time points x taps)
+        instead of O(time points x samples) for the ideal sinc.
+
+        :param timespace: optional time points to evaluate at, defaults to self.timespace.
+        :return: np.array containing the reconstructed signal.
+        """
+        timespace = self.timespace if timespace is None else timespace
+        samples = self.truncated_samples()
+        reconstructed = Precision.zeros(samples.shape[:-1] + (len(timespace),))
+        if samples.shape[-1] == 0:
+            return reconstructed
 
-        # Interpolate the reconstructed signal to match the timespace
-        reconstructed = np.interp(self.timespace, np.linspace(self.timespace[0], self.timespace[-1], len(reconstructed)), np.real(reconstructed))
+        indices, weights = self.cached(SignalReconstruction.WINDOWED_SINC, timespace,
+                                       lambda: self.windowed_sinc_weights(timespace, samples.shape[-1]), self.taps)
+        for tap_indices, tap_weights in zip(indices, weights):
+            reconstructed += tap_weights * samples[..., tap_indices]
         return reconstructed
 
+    def windowed_sinc_accuracy(self, max_points=2_000):
+        """
+        Measures how far the windowed sinc is from the ideal sinc reconstruction for the current taps.
+
+        Both are evaluated on at most `max_points` evenly strided points of the timespace.
+
+        :return: dict with the root mean squared and the maximum absolute error.
+        """
+        stride = max(len(self.timespace) // max_points, 1)
+        timespace = self.timespace[::stride]
+        error = self.windowed_sinc_interpolation(timespace) - self.nyquist_interpolation(timespace)
+        return {
+            "rmse": float(np.sqrt(np.mean(error ** 2))),
+            "max_error": float(np.max(np.abs(error)))
+        }
+
+    def fourier_series_interpolation(self, timespace=None):
+        """
+        Reconstructs the bandlimited (periodic) interpolant of the samples in the frequency domain.
+
+        The sample spectrum is zero-padded so the inverse rfft lands on a grid at least as fine as the
+        timespace (up to MAX_FOURIER_UPSAMPLING), which is then linearly interpolated onto the timespace. That grid
+        covers the whole sample period, so for timespaces with fewer points than it (zoomed in viewports) the
+        interpolant is summed directly at the time points instead, see fourier_series_sum.
+
+        :param timespace: optional time points to evaluate at, defaults to self.timespace.
+        :return: np.array containing the reconstructed signal.
+        """
+        timespace = self.timespace if timespace is None else timespace
+        samples = self.truncated_samples()
+        if samples.shape[-1] == 0:
+            return Precision.zeros(samples.shape[:-1] + (len(timespace),))
+
+        samples_count = samples.shape[-1]
+        timespace_step = (timespace[-1] - timespace[0]) / max(len(timespace) - 1, 1)
+        upsampling_factor = max(int(np.ceil(self.sampling_period / timespace_step)), 1) if timespace_step > 0 else 1
+
+        upsampling_factor = min(upsampling_factor, SignalReconstruction.MAX_FOURIER_UPSAMPLING)
+        fine_points = samples_count * upsampling_factor
+
+        spectrum = np.fft.rfft(samples)
+        direct = len(timespace) * spectrum.shape[-1] < fine_points
+        if samples_count % 2 == 0 and (upsampling_factor > 1 or direct):
+            # Split the Nyquist bin between the positive and negative frequencies of the padded spectrum
+            spectrum[..., -1] *= 0.5
+        if direct:
+            return self.fourier_series_sum(spectrum, samples_count, timespace)
+        fine_signal = np.fft.irfft(spectrum, n=fine_points) * upsampling_factor
+
+        period = samples_count * self.sampling_period
+        fine_times = self.sample_times[0] + np.arange(fine_points) * (period / fine_points)
+        if fine_signal.ndim == 1:
+            return np.interp(timespace, fine_times, fine_signal, period=period)
+        return np.array([np.interp(timespace, fine_times, row, period=period)
+                         for row in fine_signal.reshape(-1, fine_points)]).reshape(samples.shape[:-1] + (-1,))
+
+    def fourier_series_sum(self, spectrum, samples_count, timespace):
+        """
+        Evaluates the periodic interpolant of the samples with the given rfft directly at the time points.
+
+        The sum over the frequency bins is a polynomial in exp(i * 2 pi t / period), evaluated by Horner's scheme in
+        O(points x frequency bins) time and O(points) memory, whatever the zoom level.
+
+        :param spectrum: rfft of the samples, with the Nyquist bin of even counts halved.
+        """
+        period = samples_count * self.sampling_period
+        # Every bin but DC stands for itself and its negative frequency conjugate
+        coefficients = spectrum * np.where(np.arange(spectrum.shape[-1]) == 0, 1.0, 2.0) / samples_count
+        elapsed = np.remainder(np.asarray(timespace, dtype=np.float64) - self.sample_times[0], period)
+        rotation = np.exp(2j * np.pi * elapsed / period)
+
+        accumulated = np.repeat(coefficients[..., -1:], len(timespace), axis=-1)
+        for index in range(spectrum.shape[-1] - 2, -1, -1):
+            accumulated *= rotation
+            accumulated += coefficients[..., index:index + 1]
+        return Precision.values(accumulated.real)
+
     def zero_order_hold(self):
-        indices = np.searchsorted(self.sample_times, self.timespace) - 1
-        indices = np.clip(indices, 0, len(self.samples) - 1)  # Ensure valid index range
-        return self.samples[indices]
+        def build_indices():
+            indices = np.searchsorted(self.sample_times, self.timespace) - 1
+            return np.clip(indices, 0, np.shape(self.samples)[-1] - 1)  # Ensure valid index range
+
+        indices = self.cached(SignalReconstruction.ZERO_ORDER_HOLD, self.timespace, build_indices)
+        return Precision.values(self.samples)[..., indices]
 
     def linear_interpolation(self):
-        linear_interp = interp1d(self.sample_times, self.samples, kind='linear', fill_value="extrapolate")
-        return linear_interp(self.timespace)
+        """Linear interpolation between the two samples around each time point, extrapolating at the ends."""
+        samples = self.truncated_samples()
+        samples_count = samples.shape[-1]
+        if samples_count < 2:
+            constant = samples[..., :1] if samples_count else Precision.zeros(samples.shape[:-1] + (1,))
+            return np.repeat(constant, len(self.timespace), axis=-1)
+
+        def build_weights():
+            sample_times = self.sample_times[:samples_count]
+            indices = np.searchsorted(sample_times, self.timespace, side='right') - 1
+            indices = np.clip(indices, 0, samples_count - 2)
+            weights = (self.timespace - sample_times[indices]) / (sample_times[indices + 1] - sample_times[indices])
+            return indices, Precision.values(weights)
+
+        indices, weights = self.cached(SignalReconstruction.LINEAR, self.timespace, build_weights)
+        return samples[..., indices] + weights * (samples[..., indices + 1] - samples[..., indices])
 
     def polynomial_interpolation(self):
+        # scipy is imported on first use, it is only needed by this method and the cubic spline
+        from scipy.interpolate import lagrange
+
         poly = lagrange(self.sample_times, self.samples)
         return poly(self.timespace)
 
     def cubic_spline_interpolation(self):
-        spline = CubicSpline(self.sample_times, self.samples)
+        from scipy.interpolate import CubicSpline
+
+        samples = self.truncated_samples()
+        spline = CubicSpline(self.sample_times[:samples.shape[-1]], samples, axis=-1)
         return spline(self.timespace)
 
     def nearest_neighbor_interpolation(self):
-        indices = np.argmin(np.abs(self.sample_times[:, np.newaxis] - self.timespace), axis=0)
-        indices = np.clip(indices, 0, len(self.samples) - 1)  # Ensure valid index range
-        return self.samples[indices]
+        """
+        Takes, for every time point, the sample closest to it (the earlier one on ties).
+
+        The two candidate samples come from a sorted search over sample_times, so memory stays linear
+        in the timespace length.
+        """
+        if len(self.sample_times) < 2:
+            return Precision.values(self.samples)[..., np.zeros(len(self.timespace), dtype=int)]
+
+        def build_indices():
+            indices = np.searchsorted(self.sample_times, self.timespace)
+            indices = np.clip(indices, 1, len(self.sample_times) - 1)
+            previous_indices = indices - 1
+            distance_to_previous = np.abs(self.timespace - self.sample_times[previous_indices])
+            distance_to_next = np.abs(self.sample_times[indices] - self.timespace)
+            indices = np.where(distance_to_previous <= distance_to_next, previous_indices, indices)
+            return np.clip(indices, 0, np.shape(self.samples)[-1] - 1)  # Ensure valid index range
+
+        indices = self.cached(SignalReconstruction.NEAREST_NEIGHBOR, self.timespace, build_indices)
+        return Precision.values(self.samples)[..., indices]
+
+
+class ViewportReconstruction:
+    """
+    Reconstructs only the visible window of the samples' span, at roughly one point per pixel.
+
+    The window (plus a margin on each side) is covered by tiles aligned to multiples of their duration. Each tile
+    is reconstructed at a fixed number of points and kept in an LRU, so panning back over a tile is free, and
+    zooming in switches to shorter tiles with the same number of points, keeping full detail.
+    """
+    # Fraction of the visible width reconstructed on each side of it
+    MARGIN = 0.25
+
+    MAX_TILES = 64
+
+    def __init__(self, samples, sampling_frequency, sample_times, method, taps=None, max_tiles=None):
+        self.samples = samples
+        self.sampling_frequency = sampling_frequency
+        self.sample_times = sample_times
+        self.method = method
+        self.taps = taps
+        self.max_tiles = max_tiles or ViewportReconstruction.MAX_TILES
+        self.tiles = OrderedDict()
+
+    def tile(self, tile_duration, points_per_tile, index):
+        key = (tile_duration, points_per_tile, index)
+        if key in self.tiles:
+            self.tiles.move_to_end(key)
+            return self.tiles[key]
+
+        timespace = index * tile_duration + np.arange(points_per_tile) * (tile_duration / points_per_tile)
+        reconstruction = SignalReconstruction(self.samples, self.sampling_frequency, timespace, taps=self.taps,
+                                              sample_times=self.sample_times)
+        self.tiles[key] = (timespace, reconstruction.reconstruct_signal(self.method))
+        if len(self.tiles) > self.max_tiles:
+            self.tiles.popitem(last=False)
+        return self.tiles[key]
+
+    def reconstruct(self, x_min, x_max, pixels, bounds=None):
+        """
+        Reconstructs the window [x_min, x_max] displayed over `pixels` pixels.
+
+        :param bounds: optional (start, stop) outside which nothing is reconstructed.
+        :return: tuple (time points, reconstructed signal), both empty if the window is out of bounds.
+        """
+        width = max(x_max - x_min, 1e-9)
+        start, stop = x_min - width * ViewportReconstruction.MARGIN, x_max + width * ViewportReconstruction.MARGIN
+        if bounds is not None:
+            start, stop = max(start, bounds[0]), min(stop, bounds[1])
+        if start >= stop:
+            return np.empty(0), np.empty(0)
+
+        # Power-of-two tile durations and point counts give between one and two points per pixel
+        tile_duration = 2.0 ** np.ceil(np.log2(width / 2))
+        points_per_tile = int(2 ** np.ceil(np.log2(max(pixels * tile_duration / width, 2))))
+
+        tiles = [self.tile(tile_duration, points_per_tile, index)
+                 for index in range(int(np.floor(start / tile_duration)), int(np.floor(stop / tile_duration)) + 1)]
+        timespace = np.concatenate([tile_timespace for tile_timespace, _ in tiles])
+        reconstructed = np.concatenate([tile_reconstruction for _, tile_reconstruction in tiles])
+        visible = (timespace >= start) & (timespace <= stop)
+        return timespace[visible], reconstructed[visible]
@@ -4,6 +4,9 @@ import numpy as np
 
 
 class TimeDomainGraphs:
+    # Time the linked x-range has to stay still before the view range callback runs, in ms
+    VIEW_RANGE_DEBOUNCE_MS = 30
+
     def __init__(self):
         # Set up three PyQtGraph plot widgets
         self.signal_plot = pg.PlotWidget()
@@ -29,24 +32,77 @@ class TimeDomainGraphs:
         self.difference_plot_legend = pg.LegendItem(offset=(-10, 2))
         self.difference_plot_legend.setParentItem(self.difference_plot.plotItem)
 
+        # Long-lived plot items, updated in place on every redraw
+        self.signal_curve = self.signal_plot.plot(pen=self.original_pen, name='Signal')
+        self.samples_markers = self.signal_plot.plot(pen=None, symbol='x', symbolSize=10, symbolBrush='r',
+                                                     name='Samples')
+        self.reconstruction_curve = self.reconstruction_plot.plot(pen=self.reconstruction_pen,
+                                                                  name='Reconstructed Signal')
+        self.difference_curve = self.difference_plot.plot(pen=self.difference_pen)
+        self.difference_plot_legend.addItem(self.difference_curve, "Difference")
+        self.rmse_text_item = pg.TextItem("", color=(200, 50, 50), anchor=(0, 1))
+        self.difference_plot.addItem(self.rmse_text_item)
+
+        # Only draw the visible part of the curves, keeping the peaks when there are more points than pixels
+        for curve in (self.signal_curve, self.reconstruction_curve, self.difference_curve):
+            curve.setDownsampling(auto=True, method='peak')
+            curve.setClipToView(True)
+
+        # Set y-axis range from -2 to 2
+        self.difference_plot.setYRange(-2, 2)
+
         # Link the plots for synchronized panning and zooming
         self.reconstruction_plot.setXLink(self.signal_plot)
         self.reconstruction_plot.setYLink(self.signal_plot)
         self.difference_plot.setXLink(self.signal_plot)
 
+        # Notify view range changes of the linked plots once panning/zooming settles
+        self.view_range_callback = None
+        self.view_range_timer = QtCore.QTimer()
+        self.view_range_timer.setSingleShot(True)
+        self.view_range_timer.setInterval(TimeDomainGraphs.VIEW_RANGE_DEBOUNCE_MS)
+        self.view_range_timer.timeout.connect(self.notify_view_range)
+        self.signal_plot.sigXRangeChanged.connect(lambda *args: self.view_range_timer.start())
+        self.signal_plot.getViewBox().sigResized.connect(lambda *args: self.view_range_timer.start())
+
+    def set_view_range_callback(self, callback):
+        """
+        Calls callback(x_min, x_max, pixels) whenever the visible x-range of the linked plots settles.
+
+        The x-axis stops auto-ranging while a callback is set, since the drawn data then follows the view.
+        Passing None restores auto-ranging.
+        """
+        self.view_range_callback = callback
+        if callback is None:
+            self.signal_plot.enableAutoRange(axis='x')
+        else:
+            self.signal_plot.disableAutoRange(axis='x')
+            self.signal_plot.setAutoVisible(y=True)
+
+    def visible_range(self):
+        """Returns the visible x-range and the width of the signal plot's view in pixels."""
+        (x_min, x_max), _ = self.signal_plot.viewRange()
+        pixels = max(int(self.signal_plot.getViewBox().width()), 1)
+        return x_min, x_max, pixels
+
+    def notify_view_range(self):
+        if self.view_range_callback is not None:
+            self.view_range_callback(*self.visible_range())
+
     def draw_signal(self, linspace, data_points):
         """Draws a continuous signal in the signal plot."""
-        self.signal_plot.clear()
-        self.signal_plot.plot(linspace, data_points, pen=self.original_pen, name='Signal')
+        self.signal_curve.setData(linspace, data_points)
 
     def draw_samples(self, linspace, sampled_data):
         """Draws samples as 'x' markers in the signal plot."""
-        self.signal_plot.plot(linspace, sampled_data, pen=None, symbol='x', symbolSize=10, symbolBrush='r', name='Samples')
+        self.samples_markers.setData(linspace, sampled_data)
+
+    def clear_samples(self):
+        self.samples_markers.setData([], [])
 
     def draw_reconstruction(self, linspace, reconstruction_data):
         """Draws the reconstructed signal in the reconstruction plot."""
-        self.reconstruction_plot.clear()
-        self.reconstruction_plot.plot(linspace, reconstruction_data, pen=self.reconstruction_pen, name='Reconstructed Signal')
+        self.reconstruction_curve.setData(linspace, reconstruction_data)
 
     def draw_difference(self, linspace, signal_data1, signal_data2):
         """Draws the difference between two signals in the difference plot."""
@@ -54,22 +110,12 @@ class TimeDomainGraphs:
             print("Error: Signal lengths do not match.")
             return
         difference = signal_data1 - signal_data2
-        self.difference_plot.clear()
-        self.difference_plot_legend.clear()
-        original_signal = pg.PlotDataItem(linspace, signal_data1, pen=self.original_pen)
-        reconstructed_signal = pg.PlotDataItem(linspace, signal_data2, pen=self.reconstruction_pen)
+        self.draw_difference_curve(linspace, difference, np.sqrt(np.mean(difference ** 2)))
 
-        root_mean_squared_error = np.sqrt(np.mean(difference ** 2))
-        rmse_text = f"RMSE: {root_mean_squared_error:.4f}"
-        rmse_text_item = pg.TextItem(rmse_text, color=(200, 50, 50), anchor=(0, 1))
-        rmse_text_item.setPos(linspace[0], np.mean(difference))
+    def draw_difference_curve(self, linspace, difference, root_mean_squared_error):
+        """Draws an already computed difference and its RMSE, e.g. one maintained incrementally."""
+        self.rmse_text_item.setText(f"RMSE: {root_mean_squared_error:.4f}")
+        if len(linspace):
+            self.rmse_text_item.setPos(linspace[0], np.mean(difference))
 
-        self.difference_plot.addItem(rmse_text_item)
-
-        difference = pg.PlotDataItem(linspace, difference, pen=self.difference_pen)
-
-        self.difference_plot.addItem(difference)
-        self.difference_plot_legend.addItem(difference, "Difference")
-
-        # Set y-axis range from -1 to 1
-        self.difference_plot.setYRange(-2, 2)
+        self.difference_curve.setData(linspace, difference)
@@ -0,0 +1,33 @@
+"""
+Precompiles UI/grid_view.ui into UI/ui_grid_view.py, which main.py loads instead of parsing the XML at runtime.
+
+The digest of the .ui file is recorded in the module, so main.py falls back to QUiLoader once it is out of date.
+
+Usage (after editing grid_view.ui):
+    python UI/compile_ui.py
+"""
+import hashlib
+import os
+import subprocess
+
+UI_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+UI_FILE = os.path.join(UI_DIRECTORY, "grid_view.ui")
+MODULE_FILE = os.path.join(UI_DIRECTORY, "ui_grid_view.py")
+
+
+def ui_digest(ui_file=UI_FILE):
+    with open(ui_file, 'rb') as file:
+        return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+
+
+def compile_ui(ui_file=UI_FILE, module_file=MODULE_FILE):
+    source = subprocess.run(["pyside6-uic", ui_file], check=True, capture_output=True, text=True).stdout
+    with open(module_file, 'w') as file:
+        file.write(source)
+        file.write(f"\n\n# Digest of the .ui file this module was compiled from, see UI/compile_ui.py\n"
+                   f"UI_DIGEST = \"{ui_digest(ui_file)}\"\n")
+
+
+if __name__ == "__main__":
+    compile_ui()
+    print(f"Wrote {MODULE_FILE}")
@@ -0,0 +1,52 @@
+"""
+Compares peak memory and latency of SignalReconstruction.nearest_neighbor_interpolation against the
+original dense (samples x timespace) argmin over the whole sampling_freq_spinBox range.
+
+Run from the repository root:
+    python -m benchmarks.benchmark_nearest_neighbor
+"""
+import time
+import tracemalloc
+
+import numpy as np
+
+from SignalClasses import Signal
+from SignalReconstruction import SignalReconstruction
+
+
+def dense_nearest_neighbor_interpolation(reconstruction):
+    """The original implementation: argmin over a (samples x timespace) distance matrix."""
+    indices = np.argmin(np.abs(reconstruction.sample_times[:, np.newaxis] - reconstruction.timespace), axis=0)
+    indices = np.clip(indices, 0, len(reconstruction.samples) - 1)
+    return reconstruction.samples[indices]
+
+
+def measure(function):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main(sampling_frequencies=range(2, 101, 7)):
+    signal = Signal()
+    signal.update_active_component(7, 1, 0.25)
+    signal.add_frequency_component()
+    signal.update_active_component(2, 1, 0)
+
+    print(f"{'fs (Hz)':>8} {'dense (s)':>10} {'dense (MB)':>11} {'sorted (s)':>11} {'sorted (MB)':>12} {'equal':>6}")
+    for sampling_frequency in sampling_frequencies:
+        data_points_object = signal.get_data_points(np.linspace(0, 5, 5_000), False, sampling_frequency)
+        reconstruction = SignalReconstruction(data_points_object.all_samples, sampling_frequency,
+                                              data_points_object.complete_linspace)
+        dense_time, dense_peak, expected = measure(lambda: dense_nearest_neighbor_interpolation(reconstruction))
+        sorted_time, sorted_peak, actual = measure(reconstruction.nearest_neighbor_interpolation)
+        print(f"{sampling_frequency:>8} {dense_time:>10.3f} {dense_peak / 1e6:>11.1f} "
+              f"{sorted_time:>11.4f} {sorted_peak / 1e6:>12.2f} {str(np.array_equal(expected, actual)):>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Checks the float32 compute mode (see Precision) against the float64 one and compares their speed.
+
+For every reconstruction method, the signal, samples, reconstruction and spectrum are computed in both precisions
+from the same seeded signal. The RMSE between the two paths, relative to the RMS of the float64 result, must stay
+below the tolerance, and float32 must not take more time or memory than float64 over a case's methods, otherwise the
+script exits with status 1.
+
+Besides the composed signal over the studio's span, the same components are added to a loaded file and to a
+recording an hour long, whose late instants are where rounding the cosine arguments to float32 would show.
+
+Run from the repository root:
+    python -m benchmarks.benchmark_precision
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from Precision import Precision
+from SignalClasses import Signal, SignalComponent
+from SignalReconstruction import SignalReconstruction
+
+METHODS = {
+    "zero_order_hold": SignalReconstruction.ZERO_ORDER_HOLD,
+    "linear": SignalReconstruction.LINEAR,
+    "nyquist": SignalReconstruction.NYQUIST,
+    "cubic_spline": SignalReconstruction.CUBIC_SPLINE,
+    "fourier": SignalReconstruction.FOURIER,
+    "nearest_neighbor": SignalReconstruction.NEAREST_NEIGHBOR,
+    "windowed_sinc": SignalReconstruction.WINDOWED_SINC,
+}
+
+# Span and rate of the long recording
+LONG_SPAN_SECONDS = 3_600
+LONG_SPAN_RATE = 200
+FILE_PATH = "Signals/ecg_signal.csv"
+
+# Largest RMSE between the float32 and float64 paths, relative to the RMS of the float64 result. The values stay
+# around 2e-7, the direct sinc sum of the long recording (skipped, see CASES) around 1e-5.
+DEFAULT_TOLERANCE = 1e-4
+
+
+def seeded_signal(components=20, seed=0, signal=None):
+    """:param signal: signal the components are added to, a new composed signal by default."""
+    signal = signal if signal is not None else Signal()
+    signal.set_noise_seed(seed)
+    random_generator = np.random.default_rng(seed)
+    for _ in range(components):
+        signal.frequency_components.append(SignalComponent(int(random_generator.integers(1, 30)),
+                                                           float(random_generator.uniform(0.1, 2)),
+                                                           float(random_generator.uniform(0, 2))))
+    signal.SNR = 20
+    return signal
+
+
+def long_span_signal():
+    time_column = np.arange(LONG_SPAN_SECONDS * LONG_SPAN_RATE) / LONG_SPAN_RATE
+    return Signal.from_arrays(time_column, Precision.values(np.sin(2 * np.pi * 0.5 * time_column)))
+
+
+# Per case, the signal built in the current precision, the start and stop of its plotting linspace (the file's span
+# when None) and the methods skipped: the direct sinc sum over the long recording's samples takes about a minute
+CASES = {
+    "composed": (Signal, (0, 5), ()),
+    "file": (lambda: Signal.from_file(FILE_PATH), None, ()),
+    "long span": (long_span_signal, (0, LONG_SPAN_SECONDS), (SignalReconstruction.NYQUIST,)),
+}
+
+
+def run_pipeline(precision, case, method, sampling_frequency, points):
+    """
+    Computes the plot data of one update in the given precision.
+
+    :return: tuple (dict of results, seconds, peak traced bytes).
+    """
+    Precision.set(precision)
+    build_signal, span, _ = CASES[case]
+    signal = seeded_signal(signal=build_signal())
+    plotting_linspace = np.linspace(*(span or (signal.linspace_start, signal.linspace_stop)), points)
+
+    def update(signal):
+        data_points_object = signal.get_data_points(plotting_linspace, True, sampling_frequency)
+        reconstruction = SignalReconstruction(data_points_object.all_samples, sampling_frequency,
+                                              data_points_object.complete_linspace,
+                                              sample_times=data_points_object.all_samples_linspace)
+        noisy_signal = data_points_object.plot_points + data_points_object.noise
+        return {
+            "signal": noisy_signal,
+            "samples": data_points_object.all_samples,
+            "reconstruction": reconstruction.reconstruct_signal(method),
+            # The whole spectrum, so that a bin crossing DFTGraph's display threshold does not change its shape
+            "spectrum": np.abs(np.fft.rfft(Precision.values(noisy_signal))),
+        }
+
+    start = time.perf_counter()
+    results = update(signal)
+    seconds = time.perf_counter() - start
+    # Traced in a separate pass over a new signal, tracemalloc slows down the allocations it records
+    signal = seeded_signal(signal=build_signal())
+    tracemalloc.start()
+    update(signal)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return results, seconds, peak_bytes
+
+
+def relative_rmse(expected, actual):
+    if expected.shape != actual.shape:
+        return np.inf
+    scale = np.sqrt(np.mean(expected ** 2)) or 1.0
+    return float(np.sqrt(np.mean((expected - actual.astype(np.float64)) ** 2)) / scale)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="float32 against float64 compute mode.")
+    parser.add_argument("--sampling-frequency", type=float, default=50)
+    parser.add_argument("--points", type=int, default=50_000, help="points of the plotting linspace")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    args = parser.parse_args(argv)
+
+    failures = []
+    costlier = []
+    print(f"{'case':>10} {'method':>18} {'float64 (s)':>12} {'float32 (s)':>12} {'peak64 (MB)':>12} "
+          f"{'peak32 (MB)':>12} {'worst relative RMSE':>20}")
+    try:
+        for case in args.cases:
+            # Seconds and peak bytes summed over the case's methods, per precision
+            totals = np.zeros((2, 2))
+            for name, method in METHODS.items():
+                if method in CASES[case][2]:
+                    continue
+                # Untimed runs, so both precisions are timed with warm imports and reconstruction caches
+                for precision in (Precision.FLOAT64, Precision.FLOAT32):
+                    run_pipeline(precision, case, method, args.sampling_frequency, args.points)
+                expected, seconds64, peak64 = run_pipeline(Precision.FLOAT64, case, method, args.sampling_frequency,
+                                                           args.points)
+                actual, seconds32, peak32 = run_pipeline(Precision.FLOAT32, case, method, args.sampling_frequency,
+                                                         args.points)
+                errors = {key: relative_rmse(expected[key], actual[key]) for key in expected}
+                worst = max(errors, key=errors.get)
+                print(f"{case:>10} {name:>18} {seconds64:>12.4f} {seconds32:>12.4f} {peak64 / 1e6:>12.1f} "
+                      f"{peak32 / 1e6:>12.1f} {errors[worst]:>11.2e} ({worst})")
+                failures += [f"{case}/{name}/{key}: {error:.2e}" for key, error in errors.items()
+                             if error > args.tolerance]
+                totals += [[seconds64, peak64], [seconds32, peak32]]
+            # Single updates take tens of milliseconds, so the time is compared over the whole case
+            if totals[1, 0] > totals[0, 0]:
+                costlier.append(f"{case}: {totals[1, 0]:.3f} s against {totals[0, 0]:.3f} s")
+            if totals[1, 1] > totals[0, 1]:
+                costlier.append(f"{case}: {totals[1, 1] / 1e6:.1f} MB against {totals[0, 1] / 1e6:.1f} MB of peaks")
+    finally:
+        Precision.set(Precision.FLOAT64)
+
+    if failures:
+        print(f"Relative RMSE above {args.tolerance:g}: " + ", ".join(failures))
+    if costlier:
+        print("float32 not cheaper than float64: " + ", ".join(costlier))
+    if failures or costlier:
+        return 1
+    print(f"float32 within {args.tolerance:g} relative RMSE of float64 and cheaper for every case")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
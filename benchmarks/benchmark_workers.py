@@ -0,0 +1,82 @@
+"""
+Measures how the chunked reconstruction scales with the number of worker threads.
+
+Every chunked method reconstructs a long timespace with 1, 2, 4, ... workers up to the core count, with a warm
+artifact cache; the speedup is relative to a single worker and the result is checked against it.
+
+Run from the repository root:
+    python -m benchmarks.benchmark_workers --points 2000000
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from SignalClasses import Signal
+from SignalReconstruction import SignalReconstruction
+
+METHODS = {
+    "zero_order_hold": SignalReconstruction.ZERO_ORDER_HOLD,
+    "linear": SignalReconstruction.LINEAR,
+    "nyquist": SignalReconstruction.NYQUIST,
+    "cubic_spline": SignalReconstruction.CUBIC_SPLINE,
+    "nearest_neighbor": SignalReconstruction.NEAREST_NEIGHBOR,
+    "windowed_sinc": SignalReconstruction.WINDOWED_SINC,
+}
+
+
+def best_time(function, repeats=3):
+    timings = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scaling of the chunked reconstruction with worker threads.")
+    parser.add_argument("--points", type=int, default=1_000_000, help="points of the reconstructed timespace")
+    parser.add_argument("--sampling-frequency", type=float, default=50)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    signal = Signal()
+    signal.set_noise_seed(0)
+    signal.update_active_component(7, 1, 0.25)
+    signal.add_frequency_component()
+    signal.update_active_component(2, 1, 0)
+    data_points_object = signal.get_data_points(np.linspace(0, 5, 5_000), True, args.sampling_frequency)
+    timespace = np.linspace(signal.complete_linspace_start, signal.complete_linspace_stop, args.points)
+
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= args.max_workers:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != args.max_workers:
+        worker_counts.append(args.max_workers)
+
+    print(f"{'method':>18} " + " ".join(f"{f'{workers} (s)':>10}" for workers in worker_counts) +
+          f" {'speedup':>8} {'max |diff|':>12}")
+    for name, method in METHODS.items():
+        reconstruction = SignalReconstruction(data_points_object.all_samples, args.sampling_frequency, timespace,
+                                              sample_times=data_points_object.all_samples_linspace)
+        timings = []
+        expected = None
+        max_difference = 0.0
+        for workers in worker_counts:
+            SignalReconstruction.set_workers(workers)
+            reconstruction.reconstruct_signal(method)
+            seconds, result = best_time(lambda: reconstruction.reconstruct_signal(method))
+            timings.append(seconds)
+            if expected is None:
+                expected = result
+            max_difference = max(max_difference, float(np.max(np.abs(result - expected))))
+        print(f"{name:>18} " + " ".join(f"{seconds:>10.4f}" for seconds in timings) +
+              f" {timings[0] / timings[-1]:>8.1f} {max_difference:>12.2e}")
+    SignalReconstruction.set_workers(os.cpu_count() or 1)
+
+
+if __name__ == "__main__":
+    main()
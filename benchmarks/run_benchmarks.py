@@ -0,0 +1,259 @@
+"""
+Headless benchmark suite for the sampling and reconstruction hot paths.
+
+Measures wall time (best and median of the repeats) and peak traced memory of:
+    - Signal.get_data_points, over sampling frequencies and component counts
+    - Signal.from_file + get_data_points, for the Signals/*.csv fixtures and a synthetic large recording
+    - every SignalReconstruction method, with a cold and a warm artifact cache
+    - DFTGraph.compute_FFT
+    - a full plot_signal cycle of the studio, offscreen
+
+Results are written as JSON and compared against a stored baseline; cases whose median is slower than the
+baseline's by more than the tolerance ratio and by more than MIN_REGRESSION_SECONDS are reported as regressions.
+
+Run from the repository root:
+    python -m benchmarks.run_benchmarks                      # compare against benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --save-baseline      # record a new baseline
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from SignalClasses import Signal
+from SignalReconstruction import SignalReconstruction
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+RESULTS_PATH = "benchmark_results.json"
+
+SAMPLING_FREQUENCIES = (2, 10, 50, 100)
+COMPONENT_COUNTS = (1, 10, 100)
+METHODS = {
+    "zero_order_hold": SignalReconstruction.ZERO_ORDER_HOLD,
+    "linear": SignalReconstruction.LINEAR,
+    "nyquist": SignalReconstruction.NYQUIST,
+    "cubic_spline": SignalReconstruction.CUBIC_SPLINE,
+    "fourier": SignalReconstruction.FOURIER,
+    "nearest_neighbor": SignalReconstruction.NEAREST_NEIGHBOR,
+    "windowed_sinc": SignalReconstruction.WINDOWED_SINC,
+}
+
+PLOTTING_LINSPACE = np.linspace(0, 5, 5_000)
+
+# Slowdowns smaller than this are within the run to run noise of sub-millisecond cases, whatever their ratio
+MIN_REGRESSION_SECONDS = 2e-3
+
+
+def measure(function, repeats, setup=None):
+    """
+    Runs function `repeats` times, returning best and median wall time, then once more for the peak traced memory.
+
+    tracemalloc slows down every allocation it records, so the timed runs are not traced.
+    """
+    timings = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    function()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"best_seconds": min(timings), "median_seconds": statistics.median(timings), "peak_bytes": peak_bytes}
+
+
+def composed_signal(components):
+    np.random.seed(0)
+    signal = Signal()
+    for index in range(components):
+        signal.update_active_component(index % 30 + 1, 1 / (index + 1), (index % 16) / 8)
+        signal.add_frequency_component()
+    signal.SNR = 20
+    return signal
+
+
+def write_large_recording(directory, rows):
+    """Writes a synthetic recording with `rows` rows at 1 kHz, the same format as the Signals/*.csv fixtures."""
+    file_path = os.path.join(directory, f"synthetic_{rows}.csv")
+    time_column = np.arange(rows) / 1_000
+    amplitude = np.sin(2 * np.pi * 1.3 * time_column) + 0.1 * np.random.default_rng(0).standard_normal(rows)
+    np.savetxt(file_path, np.column_stack([time_column, amplitude]), delimiter=",", header="Time,Amplitude",
+               comments="", fmt="%.9g")
+    return file_path
+
+
+def signal_benchmarks(repeats):
+    results = {}
+    for components in COMPONENT_COUNTS:
+        signal = composed_signal(components)
+        for sampling_frequency in SAMPLING_FREQUENCIES:
+            results[f"signal/components={components}/fs={sampling_frequency}"] = measure(
+                lambda: signal.get_data_points(PLOTTING_LINSPACE, True, sampling_frequency), repeats)
+    return results
+
+
+def file_benchmarks(repeats, large_rows):
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        file_paths = sorted(glob.glob("Signals/*.csv"))
+        if large_rows:
+            file_paths.append(write_large_recording(directory, large_rows))
+        for file_path in file_paths:
+            name = os.path.splitext(os.path.basename(file_path))[0]
+            results[f"file/{name}/load"] = measure(lambda: Signal.from_file(file_path), repeats)
+            signal = Signal.from_file(file_path)
+            for sampling_frequency in (SAMPLING_FREQUENCIES[0], SAMPLING_FREQUENCIES[-1]):
+                results[f"file/{name}/fs={sampling_frequency}"] = measure(
+                    lambda: signal.get_data_points(PLOTTING_LINSPACE, True, sampling_frequency), repeats)
+    return results
+
+
+def reconstruction_benchmarks(repeats):
+    results = {}
+    signal = composed_signal(3)
+    for sampling_frequency in SAMPLING_FREQUENCIES:
+        data_points_object = signal.get_data_points(PLOTTING_LINSPACE, True, sampling_frequency)
+        for name, method in METHODS.items():
+            def reconstruct():
+                SignalReconstruction(data_points_object.all_samples, sampling_frequency,
+                                     data_points_object.complete_linspace,
+                                     sample_times=data_points_object.all_samples_linspace).reconstruct_signal(method)
+
+            results[f"reconstruction/{name}/fs={sampling_frequency}/cold"] = measure(
+                reconstruct, repeats, setup=SignalReconstruction.cache.clear)
+            reconstruct()
+            results[f"reconstruction/{name}/fs={sampling_frequency}/warm"] = measure(reconstruct, repeats)
+    return results
+
+
+def FFT_benchmarks(repeats):
+    from DFTGraph import DFTGraph
+
+    results = {}
+    signal = composed_signal(3)
+    data_points_object = signal.get_data_points(PLOTTING_LINSPACE, True, 10)
+    data_points = data_points_object.plot_points + data_points_object.noise
+    sampling_period = PLOTTING_LINSPACE[1] - PLOTTING_LINSPACE[0]
+    results["fft/compute_FFT"] = measure(lambda: DFTGraph.compute_FFT(data_points, sampling_period), repeats,
+                                         setup=DFTGraph.spectrum_cache.clear)
+    return results
+
+
+def plot_signal_benchmarks(repeats):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    from main import SamplingStudio
+
+    app = QApplication.instance() or QApplication([])
+    window = SamplingStudio()
+    window.plot_pipeline.wait()
+
+    results = {}
+    for sampling_frequency in (SAMPLING_FREQUENCIES[0], SAMPLING_FREQUENCIES[-1]):
+        window.sampling_freq_spinBox.setValue(sampling_frequency)
+        window.plot_pipeline.wait()
+
+        def plot_signal():
+            window.plot_signal()
+            window.plot_pipeline.wait()
+
+        results[f"plot_signal/fs={sampling_frequency}"] = measure(plot_signal, repeats)
+    window.close()
+    app.processEvents()
+    return results
+
+
+def run(repeats, large_rows, include_ui):
+    results = {}
+    results.update(signal_benchmarks(repeats))
+    results.update(file_benchmarks(repeats, large_rows))
+    results.update(reconstruction_benchmarks(repeats))
+    results.update(FFT_benchmarks(repeats))
+    if include_ui:
+        results.update(plot_signal_benchmarks(repeats))
+    return {
+        "machine": {
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def compare(results, baseline, tolerance, min_seconds=MIN_REGRESSION_SECONDS):
+    """
+    Prints every case next to its baseline and returns the names of the cases that regressed.
+
+    Medians are compared, a single lucky or unlucky repeat moves the best time more than the median.
+    """
+    regressions = []
+    print(f"{'case':<52} {'median (ms)':>11} {'baseline':>10} {'ratio':>7} {'peak (MB)':>10}")
+    for name, result in results["results"].items():
+        baseline_result = baseline.get("results", {}).get(name)
+        line = f"{name:<52} {result['median_seconds'] * 1e3:>11.2f} "
+        if baseline_result is None:
+            line += f"{'-':>10} {'-':>7} "
+        else:
+            ratio = result["median_seconds"] / max(baseline_result["median_seconds"], 1e-9)
+            line += f"{baseline_result['median_seconds'] * 1e3:>10.2f} {ratio:>7.2f} "
+            if ratio > tolerance and result["median_seconds"] - baseline_result["median_seconds"] > min_seconds:
+                regressions.append(name)
+                line += "REGRESSION "
+        print(line + f"{result['peak_bytes'] / 1e6:>10.2f}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the sampling and reconstruction hot paths.")
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--large-rows", type=int, default=1_000_000,
+                        help="rows of the synthetic recording, 0 to skip it")
+    parser.add_argument("--no-ui", action="store_true", help="skip the plot_signal cycle (needs PySide6)")
+    parser.add_argument("--output", default=RESULTS_PATH, help="JSON file the results are written to")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="slowdown ratio against the baseline reported as a regression")
+    parser.add_argument("--min-seconds", type=float, default=MIN_REGRESSION_SECONDS,
+                        help="slowdown in seconds below which a case is not reported, whatever its ratio")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeats, args.large_rows, not args.no_ui)
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as file:
+            baseline = json.load(file)
+    regressions = compare(results, baseline, args.tolerance, args.min_seconds)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(results, file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} case(s) slower than {args.tolerance}x the baseline, by more than "
+              f"{args.min_seconds * 1e3:g} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
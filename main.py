@@ -1,17 +1,36 @@
+import time
+
+# Process start, the origin of the startup timings
+STARTED = time.perf_counter()
+
+import argparse
 import json
+import sys
 import numpy as np
-import pandas as pd
 from PySide6.QtGui import QIcon
-from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QPushButton, QLabel,
                                QListWidget, QSlider, QListWidgetItem, QCheckBox, QComboBox, QDoubleSpinBox,
-                               QGridLayout, QTabWidget, QFileDialog, QSpinBox)
-from PySide6.QtCore import QFile
+                               QGridLayout, QTabWidget, QFileDialog, QSpinBox, QStatusBar)
+from PySide6.QtCore import QEvent, QFile, QTimer
 
 from SignalClasses import Signal
 from TimeDomainGraphs import TimeDomainGraphs
 from SignalReconstruction import SignalReconstruction
 from DFTGraph import DFTGraph
+from PlotPipeline import PlotPipeline, PlotRequest
+from Precision import Precision
+from Profiler import Profiler
+from LiveStream import LiveStream, SyntheticSource, FileReplaySource
+from ScenarioArchive import ScenarioArchive
+from UI.compile_ui import ui_digest
+
+try:
+    from UI import ui_grid_view
+except ImportError:
+    # Not compiled, grid_view.ui is parsed at runtime instead
+    ui_grid_view = None
+
+IMPORTED = time.perf_counter()
 
 
 class SamplingStudio(QMainWindow):
@@ -20,11 +39,12 @@ class SamplingStudio(QMainWindow):
 
         self.signal = Signal()
 
-        loader = QUiLoader()
-        file = QFile("UI/grid_view.ui")
-        file.open(QFile.ReadOnly)
-        self.ui = loader.load(file, self)
-        file.close()
+        self.ui = SamplingStudio.load_ui(self)
+        if Profiler.enabled:
+            Profiler.record("startup/ui", IMPORTED, time.perf_counter())
+        # Milestones still to be reached, see mark_startup
+        self.startup_pending = {"startup/first paint", "startup/first plot"}
+        self.ui.installEventFilter(self)
 
         self.setCentralWidget(self.ui)
         self.ui.showMaximized()
@@ -105,7 +125,22 @@ class SamplingStudio(QMainWindow):
         self.reconstruction_method_combobox.addItem("Cubic Spline", SignalReconstruction.CUBIC_SPLINE)
         self.reconstruction_method_combobox.addItem("Fourier", SignalReconstruction.FOURIER)
         self.reconstruction_method_combobox.addItem("Nearest Neighbor", SignalReconstruction.NEAREST_NEIGHBOR)
+        self.reconstruction_method_combobox.addItem("Windowed Sinc (Lanczos)", SignalReconstruction.WINDOWED_SINC)
         self.reconstruction_method_combobox.setCurrentIndex(2)
+
+        # Number of taps of the windowed sinc and its accuracy against the full sinc
+        self.sinc_taps_spinBox = self.ui.findChild(QSpinBox, "sinc_taps_spinBox")
+        self.sinc_taps_spinBox.setValue(SignalReconstruction.DEFAULT_TAPS)
+        self.sinc_accuracy_label = self.ui.findChild(QLabel, "sinc_accuracy_label")
+
+        # Reconstruct only the visible range of the time domain plots, at screen resolution
+        self.viewport_reconstruction_checkbox = self.ui.findChild(QCheckBox, "viewport_reconstruction_checkBox")
+        self.viewport_reconstruction_checkbox.setChecked(True)
+        self.live_mode_checkbox = self.ui.findChild(QCheckBox, "live_mode_checkBox")
+
+        # Computes the plots off the UI thread
+        self.plot_pipeline = PlotPipeline(self)
+        self.plot_pipeline.result_ready.connect(self.draw_plot_result)
         # controls_layout.addWidget(QLabel("Reconstruction Technique:"))
         # controls_layout.addWidget(self.reconstruction_method_combobox)
 
@@ -122,6 +157,7 @@ class SamplingStudio(QMainWindow):
         self.time_domain_graphs = TimeDomainGraphs()
 
         self.DFTGraph = DFTGraph()
+        self.toggle_viewport_reconstruction()
 
         # self.ui.findChild(QWidget, "top_left_widget").layout().addWidget(self.time_domain_graphs.signal_plot)
         # self.ui.findChild(QWidget, "top_right_widget").layout().addWidget(self.time_domain_graphs.reconstruction_plot)
@@ -148,6 +184,9 @@ class SamplingStudio(QMainWindow):
 
         self.load_scenario_button = self.ui.findChild(QPushButton, "load_scenario_button")
 
+        # Shows the rolling stage latencies when profiling is enabled
+        self.status_bar = self.ui.findChild(QStatusBar, "statusbar")
+
         # Connect signals and slots
         self.add_button.clicked.connect(self.add_component)
         self.freq_slider.valueChanged.connect(self.update_active_component)
@@ -159,7 +198,11 @@ class SamplingStudio(QMainWindow):
         self.show_samples_checkbox.stateChanged.connect(self.plot_signal)
         self.sampling_freq_spinBox.valueChanged.connect(self.plot_signal)
         self.reconstruction_method_combobox.currentIndexChanged.connect(self.plot_signal)
-        self.show_repetitions_checkbox.stateChanged.connect(self.plot_signal)
+        self.sinc_taps_spinBox.valueChanged.connect(self.plot_signal)
+        self.viewport_reconstruction_checkbox.stateChanged.connect(self.toggle_viewport_reconstruction)
+        self.viewport_reconstruction_checkbox.stateChanged.connect(self.plot_signal)
+        self.show_repetitions_checkbox.stateChanged.connect(
+            lambda: self.DFTGraph.set_show_repetitions(self.show_repetitions_checkbox.isChecked()))
         self.components_list.itemDoubleClicked.connect(self.remove_component)
         self.list_view_button.clicked.connect(self.show_list_view)
         self.grid_view_button.clicked.connect(self.show_grid_view)
@@ -170,15 +213,60 @@ class SamplingStudio(QMainWindow):
 
         self.show_list_view()
 
-        # Activate noise real-time interference with this
-        # self.timer = QtCore.QTimer()
-        # self.timer.setInterval(100)
-        # self.timer.timeout.connect(self.plot_signal)
-        # self.timer.start()
+        # Live acquisition, the plots follow a sample source instead of the static signal
+        self.live_stream = None
+        self.live_timer = QTimer()
+        self.live_timer.setInterval(LiveStream.FRAME_INTERVAL_MS)
+        self.live_timer.timeout.connect(self.update_live_plots)
+        self.live_mode_checkbox.stateChanged.connect(self.toggle_live_mode)
+
+        # The first plot is computed once the window is shown
+        QTimer.singleShot(0, self.plot_signal)
+
+    @staticmethod
+    def load_ui(parent):
+        """Builds the main window from the precompiled UI module, or from grid_view.ui if it is missing or stale."""
+        if ui_grid_view is not None and ui_grid_view.UI_DIGEST == ui_digest("UI/grid_view.ui"):
+            ui = QMainWindow(parent)
+            ui_grid_view.Ui_MainWindow().setupUi(ui)
+            return ui
+
+        from PySide6.QtUiTools import QUiLoader
+        loader = QUiLoader()
+        file = QFile("UI/grid_view.ui")
+        file.open(QFile.ReadOnly)
+        ui = loader.load(file, parent)
+        file.close()
+        return ui
 
-        self.plot_signal()
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint and "startup/first paint" in self.startup_pending:
+            self.mark_startup("startup/first paint")
+            self.ui.removeEventFilter(self)
+        return super().eventFilter(watched, event)
+
+    def mark_startup(self, name):
+        """Records the time from the process start to a startup milestone, reported once all are reached."""
+        if name not in self.startup_pending:
+            return
+        self.startup_pending.discard(name)
+        if not Profiler.enabled:
+            return
+        Profiler.record(name, STARTED, time.perf_counter())
+        if not self.startup_pending:
+            SamplingStudio.report_startup()
+
+    @staticmethod
+    def report_startup():
+        timings = Profiler.summary()
+        print("Startup: " + ", ".join(f"{name.split('/')[1]} {timings[name][1] * 1e3:.0f} ms"
+                                      for name in ("startup/imports", "startup/ui", "startup/first paint",
+                                                   "startup/first plot") if name in timings))
 
     def export_signal(self):
+        # Imported on first use, pandas alone takes a large share of the startup time
+        import pandas as pd
+
         dataPointsObject = self.signal.get_data_points(self.plotting_linspace, with_noise=False)
         data_points = dataPointsObject.plot_points
 
@@ -197,10 +285,8 @@ class SamplingStudio(QMainWindow):
             self.load_state(file_path)
 
     def load_state(self, file_path):
-        with open(file_path, 'r') as file:
-            state_data = json.load(file)
-
-        self.signal = Signal.from_dict(state_data['signal'])
+        # .dsp (JSON) or .dspz (binary, with the signal's arrays embedded) scenario
+        state_data, self.signal = ScenarioArchive.read(file_path, mapped=True)
         self.frequency_label.setText(str(self.signal.active_component.frequency) + " Hz")
         self.freq_slider.setValue(self.signal.active_component.frequency)
         self.noise_checkbox.setChecked(state_data['Noise']['show'])
@@ -210,6 +296,7 @@ class SamplingStudio(QMainWindow):
         self.reconstruction_method_combobox.setCurrentIndex(
             self.reconstruction_method_combobox.findData(state_data['reconstruction_method'])
         )
+        self.sinc_taps_spinBox.setValue(state_data.get('sinc_taps', SignalReconstruction.DEFAULT_TAPS))
         self.setSNR(int(state_data['Noise']['SNR']))
         # self.set_composition_sampling_frequency(state_data['composition_sampling_frequency'])
         self.tab_widget.setCurrentIndex(0)
@@ -219,9 +306,11 @@ class SamplingStudio(QMainWindow):
     def save_scenario(self):
         # Save the current scenario to a file
         options = QFileDialog.Options()
-        file_path, _ = QFileDialog.getSaveFileName(self, "Save Scenario", "", "Scenario Files (*.dsp);;All Files (*)",
-                                                   options=options)
-        self.save_state(file_path)
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Scenario", "",
+                                                   "Scenario Files (*.dsp);;Binary Scenario Files (*.dspz);;"
+                                                   "All Files (*)", options=options)
+        if file_path:
+            self.save_state(file_path)
 
     def save_state(self, file_path):
         state_data = {
@@ -236,8 +325,14 @@ class SamplingStudio(QMainWindow):
                 'repeat': self.show_repetitions_checkbox.isChecked()
             },
             'reconstruction_method': self.reconstruction_method_combobox.currentData(),
+            'sinc_taps': self.sinc_taps_spinBox.value(),
             # 'composition_sampling_frequency': self.get_compose_sampling_frequency()
         }
+        if file_path.endswith(ScenarioArchive.EXTENSION):
+            # Saved over the archive the signal is mapped from, its arrays are read into memory first
+            ScenarioArchive.detach(self.signal, file_path)
+            ScenarioArchive.save(file_path, state_data, self.signal)
+            return
         with open(file_path, 'w') as file:
             json.dump(state_data, file)
 
@@ -260,7 +355,7 @@ class SamplingStudio(QMainWindow):
         if type == "CSV":
             file_dialog.setNameFilter("CSV files (*.csv)")
         elif type == "DSP":
-            file_dialog.setNameFilter("DSP files (*.dsp)")
+            file_dialog.setNameFilter("DSP files (*.dsp *.dspz)")
         if file_dialog.exec():
             file_path = file_dialog.selectedFiles()[0]
             return file_path
@@ -301,52 +396,130 @@ class SamplingStudio(QMainWindow):
         self.plot_signal()
 
     def plot_signal(self):
-        with_noise = self.noise_checkbox.isChecked()
-        data_points_object = self.signal.get_data_points(self.plotting_linspace, with_noise,
-                                                         self.sampling_freq_spinBox.value())
-
-        data_points = data_points_object.plot_points
-        noise = data_points_object.noise
-        sampled_data = data_points_object.plot_samples
-        sample_linspace = data_points_object.plot_samples_linspace
-        all_samples = data_points_object.all_samples
-        complete_linspace = data_points_object.complete_linspace
-
-        if data_points is None:
+        """Submits the current state to the plot pipeline; the plots are updated once the result is ready."""
+        if self.live_mode_checkbox.isChecked():
+            self.start_live_stream()
+            return
+        viewport = None
+        if self.viewport_reconstruction_checkbox.isChecked():
+            viewport = self.time_domain_graphs.visible_range()
+        request = PlotRequest(PlotRequest.FULL,
+                              signal=self.signal.snapshot(linspaces=(self.plotting_linspace,)),
+                              plotting_linspace=self.plotting_linspace,
+                              with_noise=self.noise_checkbox.isChecked(),
+                              sampling_frequency=self.sampling_freq_spinBox.value(),
+                              method=self.reconstruction_method_combobox.currentData(),
+                              taps=self.sinc_taps_spinBox.value(),
+                              viewport=viewport)
+        self.plot_pipeline.submit(request)
+
+    def update_visible_reconstruction(self, x_min, x_max, pixels):
+        """Reconstructs and draws the visible range only, once the view of the time domain plots changes."""
+        self.plot_pipeline.submit(PlotRequest(PlotRequest.VIEWPORT, viewport=(x_min, x_max, pixels)))
+
+    def draw_plot_result(self, result):
+        data_points = result.signal_points
+        if data_points is None or self.live_mode_checkbox.isChecked():
             return
 
         # Plot the original signal
-        self.time_domain_graphs.draw_signal(self.plotting_linspace, data_points + noise)
-        # self.time_domain_graphs.draw_signal(complete_linspace, data_points + noise)
-
-        if self.show_samples_checkbox.isChecked():
-            self.time_domain_graphs.draw_samples(sample_linspace, sampled_data)
-
-        # Retrieve selected reconstruction technique
-        selected_technique = self.reconstruction_method_combobox.currentData()
-
-        # Perform reconstruction with the selected technique
-        sampling_frequency = self.sampling_freq_spinBox.value()
-        reconstruction_obj = SignalReconstruction(all_samples, sampling_frequency, complete_linspace)
-        # returns the data points to be plotted from -7.5s to 12.5s
-        reconstruction_data = reconstruction_obj.reconstruct_signal(selected_technique)
-
-        reconstruction_to_plot = np.interp(self.plotting_linspace, complete_linspace, reconstruction_data)
+        with Profiler.span("draw/signal"):
+            if result.envelope_linspace is not None:
+                self.time_domain_graphs.draw_signal(result.envelope_linspace, result.envelope_points)
+            else:
+                self.time_domain_graphs.draw_signal(result.signal_linspace, data_points + result.noise)
+
+        with Profiler.span("draw/samples"):
+            if self.show_samples_checkbox.isChecked():
+                self.time_domain_graphs.draw_samples(result.samples_linspace, result.samples)
+            else:
+                self.time_domain_graphs.clear_samples()
 
         # Plot the reconstructed signal
-        self.time_domain_graphs.draw_reconstruction(self.plotting_linspace, reconstruction_to_plot)
-        # self.time_domain_graphs.draw_reconstruction(complete_linspace, reconstruction_data)
+        with Profiler.span("draw/reconstruction"):
+            self.time_domain_graphs.draw_reconstruction(result.signal_linspace, result.reconstruction)
 
         # Difference plot
-        self.time_domain_graphs.draw_difference(self.plotting_linspace, data_points, reconstruction_to_plot)
-        # self.time_domain_graphs.draw_difference(complete_linspace, data_points, reconstruction_data)
-
-        # DFT Magnitude Plot
-        og_sampling_frequency = self.plotting_linspace[1] - self.plotting_linspace[0]
+        with Profiler.span("draw/difference"):
+            self.time_domain_graphs.draw_difference(result.signal_linspace, data_points, result.reconstruction)
+
+        # Only full updates recompute the accuracy and the DFT Magnitude Plot
+        if result.request.kind == PlotRequest.FULL:
+            self.update_sinc_accuracy(result.sinc_accuracy)
+            with Profiler.span("draw/spectrum"):
+                self.DFTGraph.draw_spectrum(result.FFT_magnitude, result.frequency_bins,
+                                            result.request.sampling_frequency,
+                                            self.show_repetitions_checkbox.isChecked())
+
+        if Profiler.enabled:
+            self.status_bar.showMessage(Profiler.status_text())
+        self.mark_startup("startup/first plot")
+
+    def toggle_viewport_reconstruction(self):
+        if self.live_mode_checkbox.isChecked():
+            # The live plots scroll with the input, toggle_live_mode restores the view range handling
+            return
+        if self.viewport_reconstruction_checkbox.isChecked():
+            self.time_domain_graphs.set_view_range_callback(self.update_visible_reconstruction)
+            self.time_domain_graphs.signal_plot.setXRange(self.plotting_linspace[0], self.plotting_linspace[-1],
+                                                          padding=0)
+        else:
+            self.time_domain_graphs.set_view_range_callback(None)
+
+    def toggle_live_mode(self):
+        if self.live_mode_checkbox.isChecked():
+            self.time_domain_graphs.set_view_range_callback(None)
+            self.time_domain_graphs.signal_plot.disableAutoRange(axis='x')
+            self.start_live_stream()
+            self.live_timer.start()
+        else:
+            self.live_timer.stop()
+            self.live_stream = None
+            self.toggle_viewport_reconstruction()
+            self.plot_signal()
 
-        show_repetitions = self.show_repetitions_checkbox.isChecked()
-        self.DFTGraph.draw_DFT_magnitude(data_points + noise, og_sampling_frequency, sampling_frequency,
-                                         show_repetitions)
+    def start_live_stream(self):
+        """Restarts the live acquisition with the current signal and sampling settings."""
+        signal = self.signal.snapshot()
+        noise_deviation = 0.0
+        if self.noise_checkbox.isChecked():
+            noise_deviation = np.sqrt(signal.signal_power() / (10 ** (signal.SNR / 10)))
+        if signal.signal_type == Signal.FROM_FILE:
+            source = FileReplaySource(signal, noise_deviation=noise_deviation)
+        else:
+            source = SyntheticSource(signal, LiveStream.DEFAULT_INPUT_RATE, noise_deviation=noise_deviation)
+        self.live_stream = LiveStream(source, self.sampling_freq_spinBox.value(),
+                                      self.reconstruction_method_combobox.currentData(),
+                                      taps=self.sinc_taps_spinBox.value(),
+                                      window=self.plotting_linspace[-1] - self.plotting_linspace[0])
+
+    def update_live_plots(self):
+        """Processes the input acquired since the last frame and scrolls the time domain plots."""
+        with Profiler.span("live/update"):
+            if self.live_stream.update() == 0:
+                return
+        with Profiler.span("live/draw"):
+            input_times, _, noisy_values = self.live_stream.input.view()
+            self.time_domain_graphs.draw_signal(input_times, noisy_values)
+            if self.show_samples_checkbox.isChecked():
+                self.time_domain_graphs.draw_samples(*self.live_stream.samples.view())
+            else:
+                self.time_domain_graphs.clear_samples()
+            output_times, reconstruction, difference = self.live_stream.output.view()
+            self.time_domain_graphs.draw_reconstruction(output_times, reconstruction)
+            self.time_domain_graphs.draw_difference_curve(output_times, difference, self.live_stream.rmse())
+            latest_time = self.live_stream.latest_time()
+            self.time_domain_graphs.signal_plot.setXRange(latest_time - self.live_stream.window, latest_time,
+                                                          padding=0)
+        if Profiler.enabled:
+            self.status_bar.showMessage(Profiler.status_text())
+
+    def update_sinc_accuracy(self, accuracy):
+        if accuracy is None:
+            self.sinc_accuracy_label.setText("")
+            return
+        self.sinc_accuracy_label.setText(f"RMSE vs sinc: {accuracy['rmse']:.2e}")
+        self.sinc_accuracy_label.setToolTip(f"Max error vs sinc: {accuracy['max_error']:.2e}")
 
     def get_snr(self):
         return self.snr_slider.value()
@@ -384,6 +557,24 @@ class SamplingStudio(QMainWindow):
 
 
 if __name__ == "__main__":
-    app = QApplication([])
+    parser = argparse.ArgumentParser(description="Sampling Theory Studio")
+    parser.add_argument("--profile", action="store_true", help="show per-stage latencies in the status bar")
+    parser.add_argument("--trace", metavar="FILE", help="also write the stage timings as a Chrome trace to FILE")
+    parser.add_argument("--precision", choices=["float64", "float32"], default="float64",
+                        help="floating point type of the computed signal values, time bases stay float64")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="threads long reconstructions are split over (default: one per core)")
+    args, qt_args = parser.parse_known_args()
+    Precision.set(args.precision)
+    if args.workers is not None:
+        SignalReconstruction.set_workers(args.workers)
+    if args.profile or args.trace:
+        Profiler.enable(tracing=args.trace is not None)
+        Profiler.record("startup/imports", STARTED, IMPORTED)
+
+    # Qt reads the program name from the first argument, which parse_known_args does not return
+    app = QApplication(sys.argv[:1] + qt_args)
     window = SamplingStudio()
     app.exec()
+    if args.trace:
+        Profiler.dump_trace(args.trace)